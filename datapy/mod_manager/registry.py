@@ -109,21 +109,9 @@ class ModRegistry:
             with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(self.registry_data, f, indent=2, ensure_ascii=False)
             
-            # Windows-compatible atomic replace
-            if os.path.exists(self.registry_path):
-                backup_file = self.registry_path + '.backup'
-                # Remove old backup if exists
-                if os.path.exists(backup_file):
-                    os.unlink(backup_file)
-                # Move current to backup
-                os.rename(self.registry_path, backup_file)
-                # Move temp to current
-                os.rename(temp_file, self.registry_path)
-                # Remove backup
-                os.unlink(backup_file)
-            else:
-                # Simple rename if target doesn't exist
-                os.rename(temp_file, self.registry_path)
+            # os.replace overwrites atomically on both POSIX and Windows, so
+            # readers never observe a missing or partially written registry
+            os.replace(temp_file, self.registry_path)
             
             logger.debug("Registry saved successfully")
             
@@ -66,7 +66,7 @@ def run(params: Dict[str, Any]) -> Dict[str, Any]:
         memory_limit = params.get("memory_limit", "4GB")
         custom_config = params.get("config", {})
         
-        logger.debug(f"Initializing DuckDB connection with memory_limit={memory_limit}")
+        logger.debug("Initializing DuckDB connection with memory_limit=%s", memory_limit)
         
         duckdb_config = {
             "memory_limit": memory_limit
@@ -74,13 +74,13 @@ def run(params: Dict[str, Any]) -> Dict[str, Any]:
         
         # Merge custom config if provided
         if custom_config and isinstance(custom_config, dict):
-            logger.debug(f"Merging {len(custom_config)} custom config settings")
+            logger.debug("Merging %d custom config settings", len(custom_config))
             duckdb_config.update(custom_config)
         
         con = duckdb.connect(":memory:", config=duckdb_config)
         
-        logger.debug(f"DuckDB connection created successfully")
-        logger.debug(f"Applied configuration: {duckdb_config}")
+        logger.debug("DuckDB connection created successfully")
+        logger.debug("Applied configuration: %s", duckdb_config)
         
         # Add artifacts
         result.add_artifact("connection", con)
@@ -0,0 +1,111 @@
+"""confluent-kafka (librdkafka) backend for the Kafka consumer.
+
+Wraps confluent_kafka.Consumer in the subset of the kafka-python
+KafkaConsumer interface the other threads use:
+- poll(timeout_ms, max_records) -> {(topic, partition): [records]}
+- commit(offsets={TopicPartition: OffsetAndMetadata})
+- close()
+
+Records expose topic/partition/offset/key/value attributes like
+kafka-python's ConsumerRecord, so workers and CSV writers are unchanged.
+Selected with kafka_client="confluent-kafka"; requires the confluent-kafka
+package.
+"""
+
+import logging
+from collections import namedtuple
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .shared_state import KafkaConsumerConfig
+
+logger = logging.getLogger(__name__)
+
+# Attribute-compatible subset of kafka-python's ConsumerRecord
+ConsumerRecord = namedtuple("ConsumerRecord", ["topic", "partition", "offset", "key", "value"])
+
+
+class ConfluentConsumerAdapter:
+    """kafka-python style facade over confluent_kafka.Consumer."""
+    
+    def __init__(self, config: 'KafkaConsumerConfig'):
+        """Create the librdkafka consumer and subscribe to the topic.
+        
+        Args:
+            config: Consumer configuration
+        
+        Raises:
+            ImportError: If confluent-kafka is not installed
+            confluent_kafka.KafkaException: If the client cannot be created
+        """
+        import confluent_kafka
+        
+        self._kafka = confluent_kafka
+        self._consumer = confluent_kafka.Consumer({
+            'bootstrap.servers': config.bootstrap_servers,
+            'group.id': config.group_id,
+            'enable.auto.commit': False,  # Manual commit only
+            'auto.offset.reset': config.auto_offset_reset
+        })
+        self._consumer.subscribe([config.topic])
+    
+    def poll(self, timeout_ms: int, max_records: int) -> Dict[Tuple[str, int], List[ConsumerRecord]]:
+        """Fetch up to max_records messages, grouped by partition.
+        
+        Args:
+            timeout_ms: Max time to wait for messages (milliseconds)
+            max_records: Max messages to return
+        
+        Returns:
+            Dict of (topic, partition) -> records in offset order
+        
+        Raises:
+            confluent_kafka.KafkaException: On a fatal consumer error
+        """
+        messages = self._consumer.consume(num_messages=max_records, timeout=timeout_ms / 1000)
+        
+        batch: Dict[Tuple[str, int], List[ConsumerRecord]] = {}
+        for message in messages:
+            error = message.error()
+            if error is not None:
+                if error.code() == self._kafka.KafkaError._PARTITION_EOF:
+                    continue
+                if error.fatal():
+                    raise self._kafka.KafkaException(error)
+                # Transient (e.g. _TRANSPORT, _ALL_BROKERS_DOWN): librdkafka
+                # recovers by itself and has already moved past the records
+                # in this batch, so they must still be returned
+                logger.warning("Kafka consumer error (non-fatal), continuing: %s", error)
+                continue
+            
+            topic = message.topic()
+            partition = message.partition()
+            records = batch.get((topic, partition))
+            if records is None:
+                records = batch[(topic, partition)] = []
+            records.append(ConsumerRecord(
+                topic, partition, message.offset(), message.key(), message.value()
+            ))
+        
+        return batch
+    
+    def commit(self, offsets: Dict[Any, Any]) -> None:
+        """Synchronously commit offsets.
+        
+        Args:
+            offsets: kafka-python style {TopicPartition: OffsetAndMetadata}
+        
+        Raises:
+            confluent_kafka.KafkaException: If the commit fails
+        """
+        self._consumer.commit(
+            offsets=[
+                self._kafka.TopicPartition(tp.topic, tp.partition, meta.offset)
+                for tp, meta in offsets.items()
+            ],
+            asynchronous=False
+        )
+    
+    def close(self) -> None:
+        """Leave the consumer group and close the client."""
+        self._consumer.close()
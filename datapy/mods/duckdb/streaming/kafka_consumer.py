@@ -50,22 +50,30 @@ def main(config_dict: Dict[str, Any]) -> Dict[str, Any]:
     
     # Create Kafka consumer
     try:
-        shared_state.kafka_consumer = KafkaConsumer(
-            config.topic,
-            bootstrap_servers=config.bootstrap_servers,
-            group_id=config.group_id,
-            enable_auto_commit=False,  # Manual commit only
-            auto_offset_reset=config.auto_offset_reset,
-            max_poll_records=config.max_poll_records,
-            consumer_timeout_ms=config.poll_timeout_ms
-        )
-        logger.info("Kafka consumer initialized successfully")
+        if config.kafka_client == "confluent-kafka":
+            from .confluent_consumer import ConfluentConsumerAdapter
+            shared_state.kafka_consumer = ConfluentConsumerAdapter(config)
+        else:
+            shared_state.kafka_consumer = KafkaConsumer(
+                config.topic,
+                bootstrap_servers=config.bootstrap_servers,
+                group_id=config.group_id,
+                enable_auto_commit=False,  # Manual commit only
+                auto_offset_reset=config.auto_offset_reset,
+                max_poll_records=config.max_poll_records,
+                consumer_timeout_ms=config.poll_timeout_ms
+            )
+        logger.info("Kafka consumer initialized successfully (client=%s)", config.kafka_client)
     except Exception as e:
         logger.critical("Failed to create Kafka consumer: %s", e, exc_info=True)
         return {"status": "error", "error": f"Kafka init failed: {e}"}
     
     # Register signal handlers
-    signal_handler = SignalHandler(callback=shared_state.stop)
+    # Shared event: wait() also returns when a thread calls shared_state.stop()
+    signal_handler = SignalHandler(
+        callback=shared_state.stop,
+        shutdown_event=shared_state.shutdown_event
+    )
     signal_handler.register()
     logger.debug("Signal handlers registered")
     
@@ -76,7 +84,7 @@ def main(config_dict: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("All threads started, consumer is now running")
         logger.info("Waiting for shutdown signal (SIGTERM/SIGINT)...")
         
-        # Block until signal received
+        # Block until signal received (or an internal shutdown)
         signal_handler.wait()
         
         logger.info("Shutdown signal received, initiating graceful shutdown")
@@ -143,7 +151,16 @@ def start_all_threads(shared_state: SharedState) -> None:
             name=f"worker-{i}",
             daemon=False  # CRITICAL: Must complete current message
         )
-        worker_thread.start()
+        # Counted in before start() so the worker's own exit can't go first
+        with shared_state.workers_lock:
+            shared_state.alive_workers += 1
+        try:
+            worker_thread.start()
+        except BaseException:
+            # Never started, so it will never count itself out
+            with shared_state.workers_lock:
+                shared_state.alive_workers -= 1
+            raise
         shared_state.threads["workers"].append(worker_thread)
     logger.debug("Started %d worker threads", config.worker_count)
     
@@ -213,13 +230,13 @@ def perform_graceful_shutdown(shared_state: SharedState) -> Dict[str, Any]:
             - clean_shutdown: True if all threads stopped cleanly
             - duration_ms: Total shutdown duration in milliseconds
     """
-    shutdown_start = time.time()
+    shutdown_start = time.monotonic()
     config = shared_state.config
     logger = shared_state.logger
     timeout = config.shutdown_timeout_seconds
     
     metrics = {
-        "messages_in_queue": shared_state.processing_queue.qsize(),
+        "messages_in_queue": sum(q.qsize() for q in shared_state.processing_queues),
         "clean_shutdown": True,
         "duration_ms": 0
     }
@@ -236,7 +253,7 @@ def perform_graceful_shutdown(shared_state: SharedState) -> Dict[str, Any]:
             logger.debug("Polling thread stopped")
     
     # 2. Wait for workers - SHARED TIMEOUT
-    queue_size = shared_state.processing_queue.qsize()
+    queue_size = sum(q.qsize() for q in shared_state.processing_queues)
     if queue_size > 0:
         logger.info("Processing queue has %d messages, waiting for workers to drain", queue_size)
     
@@ -246,17 +263,18 @@ def perform_graceful_shutdown(shared_state: SharedState) -> Dict[str, Any]:
         worker_count, timeout
     )
     
-    worker_wait_start = time.time()
+    # Monotonic clock: a wall-clock step (NTP) cannot stretch or cut the wait
+    worker_wait_start = time.monotonic()
+    deadline = worker_wait_start + timeout
     
     for i, worker_thread in enumerate(shared_state.threads["workers"]):
         # Calculate remaining timeout
-        remaining_timeout = timeout - (time.time() - worker_wait_start)
+        remaining_timeout = deadline - time.monotonic()
         
         if remaining_timeout <= 0:
-            alive_count = sum(1 for w in shared_state.threads["workers"] if w.is_alive())
             logger.warning(
                 "Worker timeout exceeded after %ds, %d workers still running",
-                timeout, alive_count
+                timeout, shared_state.alive_workers
             )
             metrics["clean_shutdown"] = False
             break
@@ -266,12 +284,14 @@ def perform_graceful_shutdown(shared_state: SharedState) -> Dict[str, Any]:
         
         # Log progress every 10 workers
         if (i + 1) % 10 == 0:
-            alive = sum(1 for w in shared_state.threads["workers"][:i+1] if w.is_alive())
-            logger.debug("Worker progress: %d/%d checked, %d still alive", i + 1, worker_count, alive)
+            logger.debug(
+                "Worker progress: %d/%d checked, %d still alive",
+                i + 1, worker_count, shared_state.alive_workers
+            )
     
-    # Check final worker status
-    alive_workers = sum(1 for w in shared_state.threads["workers"] if w.is_alive())
-    elapsed_worker_wait = time.time() - worker_wait_start
+    # Check final worker status (maintained by the workers, no thread scan)
+    alive_workers = shared_state.alive_workers
+    elapsed_worker_wait = time.monotonic() - worker_wait_start
     
     if alive_workers == 0:
         logger.info("All %d workers stopped cleanly in %.1fs", worker_count, elapsed_worker_wait)
@@ -282,6 +302,9 @@ def perform_graceful_shutdown(shared_state: SharedState) -> Dict[str, Any]:
         )
         metrics["clean_shutdown"] = False
     
+    if shared_state.timeout_pool:
+        shared_state.timeout_pool.shutdown()
+    
     # 3. Wait for commit thread (final commit)
     if shared_state.threads["commit"]:
         logger.debug("Waiting for commit thread (final offset commit)...")
@@ -318,7 +341,7 @@ def perform_graceful_shutdown(shared_state: SharedState) -> Dict[str, Any]:
         logger.error("Error closing Kafka consumer: %s", e, exc_info=True)
     
     # Calculate total shutdown duration
-    metrics["duration_ms"] = (time.time() - shutdown_start) * 1000
+    metrics["duration_ms"] = (time.monotonic() - shutdown_start) * 1000
     
     logger.info(
         "Graceful shutdown complete: clean=%s, duration=%.0fms",
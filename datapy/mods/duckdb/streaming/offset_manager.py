@@ -5,15 +5,20 @@ Implements max contiguous offset algorithm to ensure:
 - Don't skip offsets (maintain at-least-once guarantee)
 - Handle out-of-order processing
 
+Processed offsets are tracked per partition as sorted, coalesced ranges,
+so mostly-contiguous offsets cost a couple of ints per gap, not per offset.
+
 Example:
-    Processed: {1001, 1002, 1003, 1005, 1006}
+    Processed: {1001, 1002, 1003, 1005, 1006} -> ranges [1001-1003], [1005-1006]
     Last committed: 1000
     Max contiguous: 1003 (can't commit 1005 because 1004 is missing)
 """
 
 import time
 import logging
-from typing import Set, Dict, TYPE_CHECKING
+import importlib.util
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
 from kafka import TopicPartition, OffsetAndMetadata
 
 if TYPE_CHECKING:
@@ -21,6 +26,145 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Minimum time between drains while marks keep arriving (seconds)
+DRAIN_INTERVAL_SECONDS = 0.1
+
+# Batches smaller than this are added one by one; numpy's per-call
+# overhead outweighs its per-offset savings below it
+VECTORIZED_ADD_MIN = 64
+
+# numpy is optional: without it add_many finds runs in pure Python
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class OffsetRanges:
+    """Set of offsets stored as sorted, non-adjacent closed ranges.
+    
+    Offsets usually arrive almost in order, so adding one extends an
+    existing range and the set stays a handful of ranges however many
+    offsets it holds.
+    """
+    
+    __slots__ = ("_lows", "_highs")
+    
+    def __init__(self):
+        """Create an empty set."""
+        self._lows: List[int] = []
+        self._highs: List[int] = []
+    
+    def add(self, offset: int) -> None:
+        """Add an offset, merging it into adjacent ranges.
+        
+        Args:
+            offset: Offset to add (duplicates are ignored)
+        """
+        lows = self._lows
+        highs = self._highs
+        # Ranges before i start at or below offset
+        i = bisect_right(lows, offset)
+        
+        if i and highs[i - 1] >= offset - 1:
+            if highs[i - 1] >= offset:
+                return  # Already present
+            # Extends the previous range, possibly bridging to the next
+            if i < len(lows) and lows[i] == offset + 1:
+                highs[i - 1] = highs[i]
+                del lows[i]
+                del highs[i]
+            else:
+                highs[i - 1] = offset
+        elif i < len(lows) and lows[i] == offset + 1:
+            lows[i] = offset
+        else:
+            lows.insert(i, offset)
+            highs.insert(i, offset)
+    
+    def add_range(self, low: int, high: int) -> None:
+        """Add all offsets from low to high, merging overlapping ranges.
+        
+        Args:
+            low: First offset to add
+            high: Last offset to add (inclusive)
+        """
+        lows = self._lows
+        highs = self._highs
+        # Ranges i..j-1 overlap or touch [low, high]
+        i = bisect_left(highs, low - 1)
+        j = bisect_right(lows, high + 1)
+        
+        if i < j:
+            low = min(low, lows[i])
+            high = max(high, highs[j - 1])
+        lows[i:j] = [low]
+        highs[i:j] = [high]
+    
+    def add_many(self, offsets: List[int]) -> None:
+        """Add a batch of offsets.
+        
+        Large batches are sorted and split into runs (with numpy when it
+        is installed), then merged one run at a time instead of one
+        offset at a time.
+        
+        Args:
+            offsets: Offsets to add, in any order
+        """
+        if len(offsets) < VECTORIZED_ADD_MIN:
+            for offset in offsets:
+                self.add(offset)
+            return
+        
+        if not _HAS_NUMPY:
+            values = sorted(offsets)
+            low = high = values[0]
+            for offset in values:
+                if offset > high + 1:
+                    self.add_range(low, high)
+                    low = offset
+                high = offset
+            self.add_range(low, high)
+            return
+        
+        import numpy as np
+        
+        values = np.fromiter(offsets, dtype=np.int64, count=len(offsets))
+        values.sort()
+        # Runs end where the next offset skips one; duplicates stay in their run
+        breaks = np.flatnonzero(np.diff(values) > 1)
+        run_lows = values[np.concatenate(([0], breaks + 1))].tolist()
+        run_highs = values[np.concatenate((breaks, [len(values) - 1]))].tolist()
+        
+        for low, high in zip(run_lows, run_highs):
+            self.add_range(low, high)
+    
+    def trim_below(self, offset: int) -> None:
+        """Remove all offsets lower than offset.
+        
+        Args:
+            offset: Lowest offset to keep
+        """
+        i = bisect_left(self._highs, offset)
+        if i:
+            del self._lows[:i]
+            del self._highs[:i]
+        if self._lows and self._lows[0] < offset:
+            self._lows[0] = offset
+    
+    def ranges(self) -> Iterator[Tuple[int, int]]:
+        """Iterate (low, high) ranges in ascending order."""
+        return zip(self._lows, self._highs)
+    
+    def highest(self) -> int:
+        """Return the highest offset (set must not be empty)."""
+        return self._highs[-1]
+    
+    def __len__(self) -> int:
+        """Return the number of offsets in the set."""
+        return sum(self._highs) - sum(self._lows) + len(self._lows)
+    
+    def __bool__(self) -> bool:
+        """Return True if the set holds any offset."""
+        return bool(self._lows)
+
 
 def commit_loop(shared_state: 'SharedState') -> None:
     """Main commit loop - runs in dedicated thread.
@@ -43,8 +187,9 @@ def commit_loop(shared_state: 'SharedState') -> None:
         thread_logger.warning("Dev mode enabled - no commits will be made")
     
     # Tracking state
-    processed_offsets: Dict[int, Set[int]] = {}  # {partition: set(offsets)}
+    processed_offsets: Dict[int, OffsetRanges] = {}  # {partition: processed offsets}
     last_committed: Dict[int, int] = {}  # {partition: last_committed_offset}
+    topic_partitions: Dict[int, TopicPartition] = {}  # {partition: cached TopicPartition}
     
     commit_count = 0
     
@@ -67,19 +212,25 @@ def commit_loop(shared_state: 'SharedState') -> None:
         
         # Dev mode - just log what would be committed
         if config.dev_mode:
-            max_offsets = {p: max(offsets) for p, offsets in processed_offsets.items() if offsets}
+            max_offsets = {p: offsets.highest() for p, offsets in processed_offsets.items() if offsets}
             thread_logger.info("Dev mode - would commit: %s", max_offsets)
             processed_offsets.clear()
             continue
         
         # Commit offsets
-        _commit_offsets(config, consumer, processed_offsets, last_committed, thread_logger)
+        _commit_offsets(
+            config, consumer, processed_offsets, last_committed,
+            topic_partitions, thread_logger
+        )
         commit_count += 1
     
     # Final commit before shutdown
     if not config.dev_mode and processed_offsets:
         thread_logger.info("Performing final commit before shutdown")
-        _commit_offsets(config, consumer, processed_offsets, last_committed, thread_logger)
+        _commit_offsets(
+            config, consumer, processed_offsets, last_committed,
+            topic_partitions, thread_logger
+        )
         commit_count += 1
     
     thread_logger.info("Commit thread stopping: %d commits made", commit_count)
@@ -87,12 +238,14 @@ def commit_loop(shared_state: 'SharedState') -> None:
 
 def _drain_processed_queue(
     shared_state: 'SharedState',
-    processed_offsets: Dict[int, Set[int]],
+    processed_offsets: Dict[int, OffsetRanges],
     commit_interval: int
 ) -> int:
     """Drain processed queue and update processed_offsets.
     
-    Sleeps in small intervals to allow checking running flag.
+    Blocks on shared_state.processed_event, so an idle consumer does not
+    wake until a worker marks a message or stop() is called. While marks
+    keep arriving, drains at most every DRAIN_INTERVAL_SECONDS.
     
     Args:
         shared_state: Shared state object
@@ -102,73 +255,83 @@ def _drain_processed_queue(
     Returns:
         Number of entries drained
     """
-    sleep_interval = 0.1  # 100ms
-    iterations = int(commit_interval / sleep_interval)
+    deadline = time.monotonic() + commit_interval
+    processed_event = shared_state.processed_event
     drained_count = 0
     
-    for _ in range(iterations):
-        if not shared_state.running.is_set():
+    # Skip the per-entry debug line entirely unless DEBUG is enabled
+    debug_enabled = shared_state.logger.isEnabledFor(logging.DEBUG)
+    
+    while shared_state.running.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not processed_event.wait(timeout=remaining):
             break
+        # Entries put before this clear are drained below; later ones set it again
+        processed_event.clear()
+        
+        # Collect offsets per partition, then add each partition's batch at once
+        drained: Dict[int, List[int]] = {}
         
-        # Drain all available entries (non-blocking)
-        while True:
-            try:
-                partition, offset, status = shared_state.processed_queue.get_nowait()
-                
-                # Add to tracking
-                if partition not in processed_offsets:
-                    processed_offsets[partition] = set()
-                processed_offsets[partition].add(offset)
-                
-                drained_count += 1
-                
+        # Take all available entries under one queue lock (non-blocking)
+        entries = shared_state.processed_queue.drain_all()
+        drained_count += len(entries)
+        
+        for partition, offset, status in entries:
+            partition_offsets = drained.get(partition)
+            if partition_offsets is None:
+                partition_offsets = drained[partition] = []
+            partition_offsets.append(offset)
+            
+            if debug_enabled:
                 shared_state.logger.debug(
                     "Drained: partition=%d, offset=%d, status=%s",
                     partition, offset, status
                 )
-            
-            except Exception:  # queue.Empty
-                break
         
-        # Sleep briefly
-        time.sleep(sleep_interval)
+        # Add to tracking
+        for partition, offsets in drained.items():
+            if partition not in processed_offsets:
+                processed_offsets[partition] = OffsetRanges()
+            processed_offsets[partition].add_many(offsets)
+        
+        # Let further marks accumulate; stop() interrupts this wait
+        shared_state.shutdown_event.wait(
+            min(DRAIN_INTERVAL_SECONDS, deadline - time.monotonic())
+        )
     
     return drained_count
 
 
-def _find_max_contiguous(offsets: Set[int], last_committed: int) -> int:
+def _find_max_contiguous(offsets: OffsetRanges, last_committed: int) -> int:
     """Find maximum contiguous offset.
     
     Returns the highest offset that forms a contiguous sequence
-    starting from last_committed + 1.
+    starting from last_committed + 1. Ranges are already coalesced, so
+    this normally looks at the first range only.
     
     Example:
         last_committed = 1000
-        offsets = {1001, 1002, 1003, 1005, 1006}
+        offsets = [1001-1003], [1005-1006]
         Result: 1003 (can't include 1005 because 1004 is missing)
     
     CRITICAL: last_committed starts at -1 for new partitions.
     This is correct because Kafka offsets start at 0, so -1 + 1 = 0.
     
     Args:
-        offsets: Set of processed offsets
+        offsets: Processed offsets
         last_committed: Last committed offset for this partition
         
     Returns:
         Maximum contiguous offset (or last_committed if no progress)
     """
-    if not offsets:
-        return last_committed
-    
-    sorted_offsets = sorted(offsets)
     max_contiguous = last_committed
     
-    for offset in sorted_offsets:
-        if offset == max_contiguous + 1:
-            max_contiguous = offset
-        else:
+    for low, high in offsets.ranges():
+        if low > max_contiguous + 1:
             # Gap found - stop here
             break
+        # Ranges at or below last_committed (redelivered offsets) are skipped
+        max_contiguous = max(max_contiguous, high)
     
     return max_contiguous
 
@@ -176,8 +339,9 @@ def _find_max_contiguous(offsets: Set[int], last_committed: int) -> int:
 def _commit_offsets(
     config,
     consumer,
-    processed_offsets: Dict[int, Set[int]],
+    processed_offsets: Dict[int, OffsetRanges],
     last_committed: Dict[int, int],
+    topic_partitions: Dict[int, TopicPartition],
     thread_logger
 ) -> None:
     """Calculate and commit offsets to Kafka.
@@ -189,6 +353,7 @@ def _commit_offsets(
         consumer: Kafka consumer
         processed_offsets: Processed offsets per partition
         last_committed: Last committed offsets per partition
+        topic_partitions: TopicPartition cache per partition (filled lazily)
         thread_logger: Logger instance
     """
     offsets_to_commit: Dict[int, int] = {}
@@ -218,9 +383,13 @@ def _commit_offsets(
     # Commit to Kafka
     try:
         # Build commit payload
+        # The topic is fixed, so each partition's TopicPartition is built once.
+        # OffsetAndMetadata carries the new offset and cannot be reused.
         commit_payload = {}
         for partition, offset in offsets_to_commit.items():
-            tp = TopicPartition(config.topic, partition)
+            tp = topic_partitions.get(partition)
+            if tp is None:
+                tp = topic_partitions[partition] = TopicPartition(config.topic, partition)
             commit_payload[tp] = OffsetAndMetadata(offset, None)
         
         # Commit
@@ -235,9 +404,7 @@ def _commit_offsets(
             
             # Remove committed offsets from processed set
             # Keep only offsets >= next uncommitted offset
-            processed_offsets[partition] = {
-                o for o in processed_offsets[partition] if o >= offset
-            }
+            processed_offsets[partition].trim_below(offset)
             
             thread_logger.debug(
                 "Partition %d: updated last_committed=%d, remaining_processed=%d",
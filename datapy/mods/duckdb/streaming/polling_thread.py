@@ -6,21 +6,29 @@ Continuously polls messages from Kafka and distributes them to:
 
 Handles:
 - Backpressure (blocking on full processing queue)
-- UTF-8 decode errors (errors='replace')
+- Zero-copy backup entries (raw key/value bytes, decoded by the CSV writer)
+- Batched enqueue (one processing queue lock cycle per poll and shard)
+- Routing each partition to a fixed processing queue shard
 - Stop at offset feature
+- Exponential backoff on polling errors (interrupted by shutdown)
 """
 
-import time
-import queue
 import logging
+import itertools
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from .shared_state import BackupEntry
+
 if TYPE_CHECKING:
     from .shared_state import SharedState
 
 logger = logging.getLogger(__name__)
 
+# Wait after a polling error, doubled on each consecutive error up to the cap
+ERROR_BACKOFF_INITIAL_SECONDS = 0.1
+ERROR_BACKOFF_MAX_SECONDS = 10.0
+
 
 def polling_loop(shared_state: 'SharedState') -> None:
     """Main polling loop - runs in dedicated thread.
@@ -34,10 +42,16 @@ def polling_loop(shared_state: 'SharedState') -> None:
     config = shared_state.config
     consumer = shared_state.kafka_consumer
     thread_logger = shared_state.logger
+    shard_count = len(shared_state.processing_queues)
+    
+    # Log level is fixed for the thread's lifetime: skip debug argument building when off
+    debug_enabled = thread_logger.isEnabledFor(logging.DEBUG)
+    log_debug = thread_logger.debug
     
     thread_logger.info("Polling thread started")
     poll_count = 0
     message_count = 0
+    error_backoff = ERROR_BACKOFF_INITIAL_SECONDS
     
     while shared_state.running.is_set():
         try:
@@ -46,6 +60,7 @@ def polling_loop(shared_state: 'SharedState') -> None:
                 timeout_ms=config.poll_timeout_ms,
                 max_records=config.max_poll_records
             )
+            error_backoff = ERROR_BACKOFF_INITIAL_SECONDS
             
             if not message_batch:
                 # No messages - continue polling
@@ -53,16 +68,22 @@ def polling_loop(shared_state: 'SharedState') -> None:
             
             poll_count += 1
             
-            # Flatten messages from all partitions
-            messages = []
-            for partition_messages in message_batch.values():
-                messages.extend(partition_messages)
+            # Iterate messages from all partitions without copying them into one list
+            batch_size = sum(map(len, message_batch.values()))
+            messages = itertools.chain.from_iterable(message_batch.values())
             
-            message_count += len(messages)
-            thread_logger.debug(
-                "Poll #%d: Received %d messages (total: %d)",
-                poll_count, len(messages), message_count
-            )
+            message_count += batch_size
+            if debug_enabled:
+                log_debug(
+                    "Poll #%d: Received %d messages (total: %d)",
+                    poll_count, batch_size, message_count
+                )
+            
+            # Messages bound for each processing queue shard, enqueued once per poll
+            pending = [[] for _ in range(shard_count)]
+            
+            # One backup timestamp per poll: the batch arrived at the same instant
+            batch_timestamp = datetime.utcnow().isoformat()
             
             # Process each message
             for msg in messages:
@@ -76,70 +97,101 @@ def polling_loop(shared_state: 'SharedState') -> None:
                             "Reached stop_at_offset: partition=%s, offset=%d (target=%d)",
                             partition_key, msg.offset, target_offset
                         )
+                        _enqueue_for_processing(shared_state, pending, debug_enabled)
                         shared_state.stop()
                         return
                 
                 # Send to backup CSV (non-blocking)
                 if config.backup_enabled and shared_state.backup_csv_queue:
-                    try:
-                        entry = {
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "topic": msg.topic,
-                            "partition": msg.partition,
-                            "offset": msg.offset,
-                            # CRITICAL: UTF-8 with errors='replace' to avoid crashes
-                            "key": msg.key.decode('utf-8', errors='replace') if msg.key else None,
-                            "value": msg.value.decode('utf-8', errors='replace') if msg.value else None,
-                            "message_size": len(msg.value) if msg.value else 0
-                        }
-                        shared_state.backup_csv_queue.put_nowait(entry)
-                        thread_logger.debug(
+                    entry = BackupEntry(
+                        batch_timestamp,
+                        msg.topic,
+                        msg.partition,
+                        msg.offset,
+                        msg.key,
+                        msg.value,
+                        len(msg.value) if msg.value else 0
+                    )
+                    # Unbounded: never blocks or drops
+                    shared_state.backup_csv_queue.put(entry)
+                    if debug_enabled:
+                        log_debug(
                             "Backup CSV queued: offset=%d, size=%d",
-                            msg.offset, entry["message_size"]
+                            msg.offset, entry.message_size
                         )
-                    except queue.Full:
-                        thread_logger.warning(
-                            "Backup CSV queue full, skipping backup for offset %d",
-                            msg.offset
-                        )
-                
-                # Send to processing queue (blocking - backpressure)
-                try:
-                    thread_logger.debug(
-                        "Enqueuing message: partition=%d, offset=%d",
-                        msg.partition, msg.offset
-                    )
-                    
-                    shared_state.processing_queue.put(
-                        msg,
-                        timeout=config.processing_queue_put_timeout_seconds
-                    )
-                    
-                    thread_logger.debug(
-                        "Message enqueued: offset=%d, queue_size=%d",
-                        msg.offset, shared_state.processing_queue.qsize()
-                    )
                 
-                except queue.Full:
-                    # This is critical - we couldn't enqueue after timeout
-                    thread_logger.error(
-                        "Processing queue full after %ds timeout, DROPPING message: "
-                        "partition=%d, offset=%d (THIS IS DATA LOSS)",
-                        config.processing_queue_put_timeout_seconds,
-                        msg.partition, msg.offset
-                    )
-                    # Note: In production, you might want to trigger shutdown here
-                    # rather than silently dropping messages
+                pending[msg.partition % shard_count].append(msg)
+            
+            # Send to processing queue (blocking - backpressure)
+            _enqueue_for_processing(shared_state, pending, debug_enabled)
         
         except Exception as e:
             thread_logger.error(
                 "Error in polling loop: %s",
                 e, exc_info=True
             )
-            # Sleep briefly to avoid tight error loop
-            time.sleep(1)
+            # Back off to avoid a tight error loop; stop() interrupts the wait
+            shared_state.shutdown_event.wait(error_backoff)
+            error_backoff = min(error_backoff * 2, ERROR_BACKOFF_MAX_SECONDS)
     
     thread_logger.info(
         "Polling thread stopping: polled %d batches, %d messages total",
         poll_count, message_count
     )
+
+
+def _enqueue_for_processing(shared_state: 'SharedState', pending: list,
+                            debug_enabled: bool) -> None:
+    """Put a poll's messages on the processing queue shards, one batch each.
+    
+    Blocks while a shard is full (backpressure). Messages are dropped
+    only if a shard has no free slot for the whole put timeout.
+    
+    Args:
+        shared_state: Shared state object
+        pending: Per-shard lists of messages in poll order
+        debug_enabled: Whether the logger has DEBUG enabled
+    """
+    config = shared_state.config
+    thread_logger = shared_state.logger
+    
+    for shard, messages in enumerate(pending):
+        if messages:
+            _enqueue_shard(shared_state, shard, messages, config, thread_logger, debug_enabled)
+
+
+def _enqueue_shard(shared_state: 'SharedState', shard: int, messages: list,
+                   config, thread_logger, debug_enabled: bool) -> None:
+    """Put messages on one processing queue shard, logging any dropped.
+    
+    Args:
+        shared_state: Shared state object
+        shard: Processing queue shard index
+        messages: Messages in poll order
+        config: Configuration object
+        thread_logger: Logger instance
+        debug_enabled: Whether the logger has DEBUG enabled
+    """
+    processing_queue = shared_state.processing_queues[shard]
+    enqueued = processing_queue.put_many(
+        messages,
+        timeout=config.processing_queue_put_timeout_seconds
+    )
+    
+    # qsize() takes the queue mutex: only pay for it when debug is on
+    if debug_enabled:
+        thread_logger.debug(
+            "Enqueued %d messages on shard %d: last_offset=%d, queue_size=%d",
+            enqueued, shard, messages[-1].offset, processing_queue.qsize()
+        )
+    
+    for msg in messages[enqueued:]:
+        # This is critical - we couldn't enqueue after timeout
+        thread_logger.error(
+            "Processing queue full after %ds timeout, DROPPING message: "
+            "partition=%d, offset=%d (THIS IS DATA LOSS)",
+            config.processing_queue_put_timeout_seconds,
+            msg.partition, msg.offset
+        )
+        # Note: In production, you might want to trigger shutdown here
+        # rather than silently dropping messages
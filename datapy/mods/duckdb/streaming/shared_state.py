@@ -2,23 +2,37 @@
 
 This module contains:
 - KafkaConsumerConfig: All configuration parameters
+- BackupEntry: Backup CSV queue record
+- DLQEntry: DLQ queue record
+- BatchQueue: queue.Queue with batched put/get
 - SharedState: Thread-safe shared state (queues, events, threads)
 - validate_config: Configuration validation
 """
 
-from dataclasses import dataclass
-from typing import Callable, Any, Optional, Dict, Tuple
+from collections import deque, namedtuple
+from dataclasses import dataclass, fields
+from typing import Callable, Any, Optional, Dict, List, Sequence, Tuple
 import threading
 import queue
+import time
 import os
+import importlib.util
 import logging
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KafkaConsumerConfig:
     """Configuration for Kafka consumer.
     
     All timeouts and intervals are configurable to avoid hardcoded values.
+    Read-only once created: every thread shares the same instance.
+    
+    Memory: only the processing queue is bounded (queue_size). The backup
+    CSV and DLQ queues are unbounded so no message is ever dropped from
+    the backup or DLQ; if their writer falls behind (slow disk, failure
+    bursts) they grow in memory instead. csv_batch_size,
+    dlq_csv_batch_size and csv_flush_interval_seconds set how fast they
+    drain, and dlq_stack_trace_limit how much each queued failure holds.
     """
     
     # Required parameters
@@ -31,10 +45,13 @@ class KafkaConsumerConfig:
     poll_timeout_ms: int = 1000
     max_poll_records: int = 100
     auto_offset_reset: str = "latest"
+    kafka_client: str = "kafka-python"  # or "confluent-kafka" (librdkafka, needs confluent-kafka)
     
     # Processing settings
     worker_count: int = 50
     queue_size: int = 200
+    worker_batch_size: int = 1  # Max messages a worker takes at once (>1 trades burst fan-out for less queue locking)
+    processing_queue_shards: int = 1  # >1 splits the queue; partitions map to fixed shards
     max_message_size: int = 10_485_760  # 10MB
     processing_timeout: Optional[int] = None  # None = no timeout
     
@@ -49,12 +66,18 @@ class KafkaConsumerConfig:
     csv_flush_interval_seconds: int = 5
     csv_batch_size: int = 1000
     dlq_csv_batch_size: int = 100
-    csv_rotation_check_interval_seconds: int = 60
+    csv_rotation_check_interval_seconds: int = 60  # Deprecated, ignored: rotation runs on an hourly deadline
+    csv_compression: Optional[str] = None  # None, "gzip" or "zstd" (one member/frame per flushed batch)
+    dlq_format: str = "csv"  # "csv" or "parquet" (columnar, needs duckdb + pyarrow)
+    # Innermost frames kept per DLQ stack trace, trimmed when the failure is
+    # queued. None = no cap: full traceback, all its frames held in memory
+    # until written. 0 = no stack trace
+    dlq_stack_trace_limit: Optional[int] = 10
     
     # Internal timeouts (configurable, not hardcoded)
     queue_get_timeout_seconds: float = 0.1
     processing_queue_put_timeout_seconds: int = 60
-    worker_queue_get_timeout_seconds: int = 1
+    worker_queue_get_timeout_seconds: int = 1  # Deprecated, ignored: idle workers are woken by stop()
     
     # Shutdown settings
     shutdown_timeout_seconds: int = 30
@@ -65,6 +88,161 @@ class KafkaConsumerConfig:
     mod_name: str = "kafka_consumer"
 
 
+# One backup CSV row per polled message, fields in backup CSV column order.
+# key and value hold the raw message bytes; the backup CSV thread decodes them.
+BackupEntry = namedtuple(
+    "BackupEntry",
+    ["timestamp", "topic", "partition", "offset", "key", "value", "message_size"]
+)
+
+
+@dataclass(slots=True)
+class DLQEntry:
+    """One failed message on its way to the DLQ writer.
+    
+    The stack trace is formatted from exception by the DLQ writer. Until
+    then exception pins its traceback frames, trimmed to
+    dlq_stack_trace_limit (unless that is None).
+    """
+    msg: Any
+    error_type: str
+    error_message: str
+    exception: Optional[BaseException]
+    processing_time_ms: float
+
+
+class BatchQueue(queue.Queue):
+    """FIFO queue with bulk operations.
+    
+    put_many(), get_batch() and drain_all() move many items per lock
+    acquisition and wake waiters once per batch instead of once per item.
+    Single-item put()/get() keep their queue.Queue behavior.
+    
+    close() releases consumers blocked in get_batch(), so they can wait
+    without a timeout.
+    """
+    
+    def __init__(self, maxsize: int = 0):
+        """Initialize an open queue.
+        
+        Args:
+            maxsize: Max queued items (<= 0 = unbounded)
+        """
+        super().__init__(maxsize)
+        self._closed = False
+        self._waiting = 0  # Consumers inside get_batch(), for fair shares
+    
+    def close(self) -> None:
+        """Wake every get_batch() waiter; from now on it returns [] when empty."""
+        with self.mutex:
+            self._closed = True
+            self.not_empty.notify_all()
+    
+    def put_many(self, items: Sequence[Any], timeout: Optional[float] = None) -> int:
+        """Put items in order, blocking for free slots if the queue is bounded.
+        
+        Items are added as space frees up, so consumers can start on the
+        head of the batch while the tail is still waiting for room.
+        
+        Args:
+            items: Items to enqueue
+            timeout: Max seconds to wait for a free slot, restarted each
+                time items are added, as for one put() per item
+                (None = forever)
+            
+        Returns:
+            Number of items enqueued; less than len(items) only if no slot
+            freed up for timeout seconds
+        """
+        total = len(items)
+        done = 0
+        endtime = None if timeout is None else time.monotonic() + timeout
+        
+        with self.not_full:
+            while done < total:
+                free = self.maxsize - self._qsize() if self.maxsize > 0 else total
+                if free <= 0:
+                    if endtime is None:
+                        self.not_full.wait()
+                        continue
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.not_full.wait(remaining)
+                    continue
+                
+                count = min(free, total - done)
+                self.queue.extend(items[done:done + count])
+                done += count
+                self.unfinished_tasks += count
+                self.not_empty.notify(count)
+                if endtime is not None:
+                    endtime = time.monotonic() + timeout
+        
+        return done
+    
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Remove up to max_items, waiting only for the first one.
+        
+        Takes at most a fair share of the queued items (rounded up) among
+        this caller and the consumers still waiting, so a burst smaller
+        than consumers * max_items is spread across idle consumers instead
+        of going to the first few to wake.
+        
+        Args:
+            max_items: Maximum number of items to return
+            timeout: Max seconds to wait for an item (None = forever)
+            
+        Returns:
+            List of items in FIFO order; empty if timeout expired or the
+            queue is closed and empty
+        """
+        with self.not_empty:
+            self._waiting += 1
+            try:
+                if timeout is None:
+                    while not self._qsize():
+                        if self._closed:
+                            return []
+                        self.not_empty.wait()
+                else:
+                    endtime = time.monotonic() + timeout
+                    while not self._qsize():
+                        if self._closed:
+                            return []
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0:
+                            return []
+                        self.not_empty.wait(remaining)
+            finally:
+                self._waiting -= 1
+            
+            # Ceiling division: the last waiters may find nothing left
+            fair_share = -(-self._qsize() // (self._waiting + 1))
+            count = min(max_items, fair_share)
+            popleft = self.queue.popleft
+            items = [popleft() for _ in range(count)]
+            self.not_full.notify(count)
+            return items
+    
+    def drain_all(self) -> deque:
+        """Remove and return every queued item without waiting.
+        
+        Swaps out the internal deque, so the cost is one lock acquisition
+        however many items are queued.
+        
+        Returns:
+            Deque of items in FIFO order (empty if none were queued)
+        """
+        with self.mutex:
+            items = self.queue
+            if not items:
+                return deque()  # Never hand out the live deque
+            self.queue = deque()
+            self.not_full.notify_all()
+            return items
+
+
 class SharedState:
     """Thread-safe shared state for Kafka consumer.
     
@@ -88,18 +266,38 @@ class SharedState:
         self.running = threading.Event()
         self.running.set()  # Initially running
         self.shutdown_event = threading.Event()
+        self.processed_event = threading.Event()  # Set when processed_queue gets entries
         
         # Thread-safe queues
-        self.processing_queue: queue.Queue = queue.Queue(maxsize=config.queue_size)
-        self.processed_queue: queue.Queue = queue.Queue()  # Unbounded
-        self.backup_csv_queue: Optional[queue.Queue] = (
-            queue.Queue() if config.backup_enabled else None
+        # Partition p goes to shard p % shards; worker i reads shard i % shards
+        shard_size = -(-config.queue_size // config.processing_queue_shards)
+        self.processing_queues: List[BatchQueue] = [
+            BatchQueue(maxsize=shard_size)
+            for _ in range(config.processing_queue_shards)
+        ]
+        # The whole processing queue with the default single shard
+        self.processing_queue: BatchQueue = self.processing_queues[0]
+        self.processed_queue: BatchQueue = BatchQueue()  # Unbounded
+        # Unbounded, never joined: SimpleQueue (C implementation) is enough
+        self.backup_csv_queue: Optional[queue.SimpleQueue] = (
+            queue.SimpleQueue() if config.backup_enabled else None
         )
-        self.dlq_queue: queue.Queue = queue.Queue()  # Unbounded
+        self.dlq_queue: queue.SimpleQueue = queue.SimpleQueue()  # Unbounded
         
         # Kafka consumer (initialized later)
         self.kafka_consumer = None
         
+        # Runs processor calls for workers when processing_timeout is set
+        self.timeout_pool = None
+        if config.processing_timeout:
+            from .worker_pool import TimeoutCallPool  # worker_pool imports this module
+            self.timeout_pool = TimeoutCallPool()
+        
+        # Workers still inside worker_loop: start_all_threads counts each one
+        # in before starting it, and each worker counts itself out on exit
+        self.alive_workers = 0
+        self.workers_lock = threading.Lock()
+        
         # Thread references
         self.threads: Dict[str, Any] = {
             "polling": None,
@@ -136,6 +334,33 @@ class SharedState:
         """Signal all threads to stop gracefully."""
         self.running.clear()
         self.shutdown_event.set()
+        self.processed_event.set()  # Wake the commit thread
+        for processing_queue in self.processing_queues:
+            processing_queue.close()  # Wake idle workers
+
+
+# Config fields kept for compatibility that no longer affect behavior
+_DEPRECATED_CONFIG_FIELDS = (
+    "csv_rotation_check_interval_seconds",
+    "worker_queue_get_timeout_seconds",
+)
+
+
+def _check_writable_dir(path: str, label: str) -> None:
+    """Check that an output directory exists and is writable.
+    
+    os.access is kept over st_mode bits: it also honours ownership,
+    ACLs and read-only mounts.
+    
+    Args:
+        path: Directory to check
+        label: Output name used in error messages
+        
+    Raises:
+        AssertionError: If the directory is missing or not writable
+    """
+    assert os.path.exists(path), f"{label} directory does not exist: {path}"
+    assert os.access(path, os.W_OK), f"{label} directory not writable: {path}"
 
 
 def validate_config(config: KafkaConsumerConfig) -> None:
@@ -153,9 +378,24 @@ def validate_config(config: KafkaConsumerConfig) -> None:
     assert isinstance(config.group_id, str), "group_id must be string"
     assert callable(config.processor_callable), "processor_callable must be callable"
     
+    # Kafka client
+    assert config.kafka_client in ("kafka-python", "confluent-kafka"), (
+        "kafka_client must be 'kafka-python' or 'confluent-kafka'"
+    )
+    if config.kafka_client == "confluent-kafka":
+        assert importlib.util.find_spec("confluent_kafka") is not None, (
+            "kafka_client='confluent-kafka' requires the confluent-kafka package"
+        )
+    
     # Range checks
     assert 1 <= config.worker_count <= 1000, "worker_count must be 1-1000"
     assert config.queue_size >= 10, "queue_size must be >= 10"
+    assert 1 <= config.worker_batch_size <= config.queue_size, (
+        "worker_batch_size must be between 1 and queue_size"
+    )
+    assert 1 <= config.processing_queue_shards <= config.worker_count, (
+        "processing_queue_shards must be between 1 and worker_count"
+    )
     assert config.commit_interval_seconds >= 1, "commit_interval_seconds must be >= 1"
     assert config.max_message_size > 0, "max_message_size must be > 0"
     assert config.shutdown_timeout_seconds > 0, "shutdown_timeout_seconds must be > 0"
@@ -164,13 +404,27 @@ def validate_config(config: KafkaConsumerConfig) -> None:
     assert config.poll_timeout_ms > 0, "poll_timeout_ms must be > 0"
     assert config.queue_get_timeout_seconds > 0, "queue_get_timeout_seconds must be > 0"
     assert config.processing_queue_put_timeout_seconds > 0, "processing_queue_put_timeout_seconds must be > 0"
-    assert config.worker_queue_get_timeout_seconds > 0, "worker_queue_get_timeout_seconds must be > 0"
     
     # CSV settings
     assert config.csv_flush_interval_seconds > 0, "csv_flush_interval_seconds must be > 0"
     assert config.csv_batch_size > 0, "csv_batch_size must be > 0"
     assert config.dlq_csv_batch_size > 0, "dlq_csv_batch_size must be > 0"
-    assert config.csv_rotation_check_interval_seconds > 0, "csv_rotation_check_interval_seconds must be > 0"
+    assert config.csv_compression in (None, "gzip", "zstd"), (
+        "csv_compression must be None, 'gzip' or 'zstd'"
+    )
+    if config.csv_compression == "zstd":
+        assert importlib.util.find_spec("zstandard") is not None, (
+            "csv_compression='zstd' requires the zstandard package"
+        )
+    assert config.dlq_format in ("csv", "parquet"), "dlq_format must be 'csv' or 'parquet'"
+    assert config.dlq_stack_trace_limit is None or config.dlq_stack_trace_limit >= 0, (
+        "dlq_stack_trace_limit must be None or >= 0"
+    )
+    if config.dlq_format == "parquet":
+        for package in ("duckdb", "pyarrow"):
+            assert importlib.util.find_spec(package) is not None, (
+                f"dlq_format='parquet' requires the {package} package"
+            )
     
     # Stop at offset validation
     if config.stop_at_offset:
@@ -184,17 +438,27 @@ def validate_config(config: KafkaConsumerConfig) -> None:
             )
     
     # File path validation - CRITICAL for CSV reliability
+    dlq_dir = os.path.dirname(config.dlq_path) or "."
     if config.backup_enabled:
         backup_dir = os.path.dirname(config.backup_path) or "."
-        assert os.path.exists(backup_dir), f"Backup directory does not exist: {backup_dir}"
-        assert os.access(backup_dir, os.W_OK), f"Backup directory not writable: {backup_dir}"
+        _check_writable_dir(backup_dir, "Backup")
+        checked_dir = backup_dir
+    else:
+        checked_dir = None
     
-    dlq_dir = os.path.dirname(config.dlq_path) or "."
-    assert os.path.exists(dlq_dir), f"DLQ directory does not exist: {dlq_dir}"
-    assert os.access(dlq_dir, os.W_OK), f"DLQ directory not writable: {dlq_dir}"
+    if dlq_dir != checked_dir:  # Usually both files share a directory
+        _check_writable_dir(dlq_dir, "DLQ")
     
     # Log level validation
     valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
     assert config.log_level.upper() in valid_log_levels, (
         f"log_level must be one of {valid_log_levels}"
     )
+    
+    # Deprecated settings are accepted but ignored; warn on the consumer's
+    # logger (DeprecationWarning is hidden by default) if one was changed
+    consumer_logger = logging.getLogger(config.mod_name)
+    defaults = {field.name: field.default for field in fields(KafkaConsumerConfig)}
+    for name in _DEPRECATED_CONFIG_FIELDS:
+        if getattr(config, name) != defaults[name]:
+            consumer_logger.warning("%s is deprecated and has no effect", name)
@@ -25,14 +25,21 @@ class SignalHandler:
         handler.restore()  # Clean up
     """
     
-    def __init__(self, callback: Optional[Callable[[], None]] = None):
+    def __init__(
+        self,
+        callback: Optional[Callable[[], None]] = None,
+        shutdown_event: Optional[threading.Event] = None
+    ):
         """Initialize signal handler.
         
         Args:
             callback: Function to call when signal received (takes no args)
+            shutdown_event: Event to set on signal and block on in wait().
+                Passing the service's own shutdown event lets wait() also
+                return when the service stops itself (default: new Event)
         """
         self.callback = callback
-        self.shutdown_event = threading.Event()
+        self.shutdown_event = shutdown_event if shutdown_event is not None else threading.Event()
         self._original_handlers: Dict[signal.Signals, Any] = {}
     
     def _handle_signal(self, signum: int, frame: Any) -> None:
@@ -72,7 +79,7 @@ class SignalHandler:
         """Block until signal received.
         
         This method blocks the calling thread until a registered signal
-        is received.
+        is received, or until a shared shutdown_event is set elsewhere.
         """
         logger.debug("Waiting for shutdown signal...")
         self.shutdown_event.wait()
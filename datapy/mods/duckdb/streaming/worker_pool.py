@@ -1,10 +1,10 @@
 """Worker pool for message processing.
 
 Each worker thread:
-1. Pulls messages from processing queue
+1. Pulls batches of messages from processing queue
 2. Validates message size
 3. Calls user-provided processor_callable
-4. Handles timeouts (if configured)
+4. Handles timeouts (if configured, via a shared TimeoutCallPool)
 5. Routes failures to DLQ
 6. Marks messages as processed for offset tracking
 """
@@ -12,9 +12,11 @@ Each worker thread:
 import time
 import queue
 import threading
-import traceback
 import logging
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, List, Tuple, TYPE_CHECKING
+
+from .shared_state import DLQEntry
 
 if TYPE_CHECKING:
     from .shared_state import SharedState
@@ -25,8 +27,26 @@ logger = logging.getLogger(__name__)
 def worker_loop(shared_state: 'SharedState', worker_id: int) -> None:
     """Main worker loop - runs in dedicated thread.
     
-    Continuously processes messages from the processing queue.
-    Stops when shared_state.running is cleared AND queue is empty.
+    Continuously processes messages from its processing queue shard
+    (worker_id % shard count), taking up to config.worker_batch_size at a time.
+    Stops when shared_state.running is cleared; messages of the current
+    batch not yet started are left unprocessed (and uncommitted).
+    
+    Decrements shared_state.alive_workers on exit, however the loop ends.
+    
+    Args:
+        shared_state: Shared state object
+        worker_id: Unique worker ID (0 to worker_count-1)
+    """
+    try:
+        _run_worker(shared_state, worker_id)
+    finally:
+        with shared_state.workers_lock:
+            shared_state.alive_workers -= 1
+
+
+def _run_worker(shared_state: 'SharedState', worker_id: int) -> None:
+    """Process batches until shared_state.running is cleared.
     
     Args:
         shared_state: Shared state object
@@ -34,74 +54,96 @@ def worker_loop(shared_state: 'SharedState', worker_id: int) -> None:
     """
     config = shared_state.config
     thread_logger = shared_state.logger
+    processing_queue = shared_state.processing_queues[
+        worker_id % len(shared_state.processing_queues)
+    ]
     
     thread_logger.debug("Worker %d started", worker_id)
     processed_count = 0
     failed_count = 0
+    # Per-message log calls are skipped outright unless their level is on
+    # (level is not expected to change while the consumer runs)
+    debug_enabled = thread_logger.isEnabledFor(logging.DEBUG)
+    info_enabled = thread_logger.isEnabledFor(logging.INFO)
+    # Checked before every message
+    is_running = shared_state.running.is_set
+    # Config read per message, copied to locals once
+    max_message_size = config.max_message_size  # Falsy = no size limit
+    processing_timeout = config.processing_timeout
+    processor_callable = config.processor_callable
+    batch_size = config.worker_batch_size
     
-    while shared_state.running.is_set():
-        try:
-            # Get message from queue (with timeout to allow checking running flag)
-            msg = shared_state.processing_queue.get(
-                timeout=config.worker_queue_get_timeout_seconds
-            )
-        except queue.Empty:
-            # No messages available, loop continues
-            continue
-        
-        start_time = time.time()
-        
-        # Log message received
-        thread_logger.debug(
-            "Worker %d processing: partition=%d, offset=%d",
-            worker_id, msg.partition, msg.offset
-        )
-        
-        # Validate message size
-        msg_size = len(msg.value) if msg.value else 0
-        if config.max_message_size and msg_size > config.max_message_size:
-            thread_logger.warning(
-                "Worker %d: Message size %d exceeds max %d, sending to DLQ: offset=%d",
-                worker_id, msg_size, config.max_message_size, msg.offset
-            )
-            _send_to_dlq(
-                shared_state,
-                msg,
-                Exception(f"Message size {msg_size} exceeds max {config.max_message_size}"),
-                0
-            )
-            _mark_processed(shared_state, msg, "failed")
-            failed_count += 1
-            continue
+    while is_running():
+        # Take up to worker_batch_size messages per queue lock cycle.
+        # Idle workers sleep here until messages arrive; stop() closes the
+        # queue, which returns [] so the running flag is rechecked
+        batch = processing_queue.get_batch(batch_size)
         
-        # Process message
-        try:
-            if config.processing_timeout:
-                # Process with timeout
-                _process_with_timeout(config, msg, thread_logger)
-            else:
-                # Process without timeout
-                config.processor_callable(msg.value)
+        # (partition, offset, status) per finished message, handed to the
+        # commit thread in one queue operation per batch
+        marks = []
+        for msg in batch:
+            if not is_running():
+                # Left unmarked, so offsets from here on are not committed
+                break
             
-            # Success
-            processing_time_ms = (time.time() - start_time) * 1000
-            thread_logger.info(
-                "Worker %d processed: partition=%d, offset=%d, time=%.0fms",
-                worker_id, msg.partition, msg.offset, processing_time_ms
-            )
-            _mark_processed(shared_state, msg, "success")
-            processed_count += 1
+            # Log message received
+            if debug_enabled:
+                thread_logger.debug(
+                    "Worker %d processing: partition=%d, offset=%d",
+                    worker_id, msg.partition, msg.offset
+                )
+            
+            # Validate message size
+            msg_size = len(msg.value) if msg.value else 0
+            if max_message_size and msg_size > max_message_size:
+                thread_logger.warning(
+                    "Worker %d: Message size %d exceeds max %d, sending to DLQ: offset=%d",
+                    worker_id, msg_size, max_message_size, msg.offset
+                )
+                _send_to_dlq(
+                    shared_state,
+                    msg,
+                    Exception(f"Message size {msg_size} exceeds max {max_message_size}"),
+                    0
+                )
+                marks.append((msg.partition, msg.offset, "failed"))
+                failed_count += 1
+                continue
+            
+            # Process message (monotonic clock: durations immune to clock steps)
+            start_time = time.monotonic()
+            try:
+                if processing_timeout:
+                    # Process with timeout
+                    _process_with_timeout(config, shared_state.timeout_pool, msg, thread_logger)
+                else:
+                    # Process without timeout
+                    processor_callable(msg.value)
+            
+                # Success
+                if info_enabled:
+                    processing_time_ms = (time.monotonic() - start_time) * 1000
+                    thread_logger.info(
+                        "Worker %d processed: partition=%d, offset=%d, time=%.0fms",
+                        worker_id, msg.partition, msg.offset, processing_time_ms
+                    )
+                marks.append((msg.partition, msg.offset, "success"))
+                processed_count += 1
+            
+            except Exception as e:
+                # Failure - send to DLQ
+                processing_time_ms = (time.monotonic() - start_time) * 1000
+                thread_logger.error(
+                    "Worker %d failed: partition=%d, offset=%d, error=%s, time=%.0fms",
+                    worker_id, msg.partition, msg.offset, type(e).__name__, processing_time_ms
+                )
+                _send_to_dlq(shared_state, msg, e, processing_time_ms)
+                marks.append((msg.partition, msg.offset, "failed"))
+                failed_count += 1
         
-        except Exception as e:
-            # Failure - send to DLQ
-            processing_time_ms = (time.time() - start_time) * 1000
-            thread_logger.error(
-                "Worker %d failed: partition=%d, offset=%d, error=%s, time=%.0fms",
-                worker_id, msg.partition, msg.offset, type(e).__name__, processing_time_ms
-            )
-            _send_to_dlq(shared_state, msg, e, processing_time_ms)
-            _mark_processed(shared_state, msg, "failed")
-            failed_count += 1
+        if marks:
+            _mark_processed(shared_state, marks)
     
     thread_logger.info(
         "Worker %d stopping: processed=%d, failed=%d",
@@ -109,14 +151,98 @@ def worker_loop(shared_state: 'SharedState', worker_id: int) -> None:
     )
 
 
-def _process_with_timeout(config, msg, thread_logger) -> None:
+class TimeoutCallPool:
+    """Reusable daemon threads for running processor calls under a timeout.
+    
+    A new thread is started only when no idle one is available, so a call
+    that hangs past its timeout ties up just its own thread and never delays
+    later calls (a fixed-size executor would fill up with hung calls). As
+    with a bare daemon thread per call, a hung call is abandoned, not
+    killed, and does not block interpreter exit.
+    """
+    
+    def __init__(self, name: str = "processor"):
+        """Initialize an empty pool.
+        
+        Args:
+            name: Thread name prefix
+        """
+        self._name = name
+        self._calls = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0  # Threads waiting on (or returning to) self._calls
+        self._started = 0
+        self._closed = False
+    
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run fn(*args) on a pool thread.
+        
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+        
+        Returns:
+            Future holding the call's result or exception
+        """
+        future = Future()
+        with self._lock:
+            if self._idle:
+                # Reserve an idle thread for this call
+                self._idle -= 1
+                thread_number = None
+            else:
+                self._started += 1
+                thread_number = self._started
+        
+        self._calls.put((future, fn, args))
+        if thread_number is not None:
+            threading.Thread(
+                target=self._run,
+                name=f"{self._name}-{thread_number}",
+                daemon=True  # A hung processor must not block exit
+            ).start()
+        return future
+    
+    def shutdown(self) -> None:
+        """Stop idle threads; busy threads exit when their call returns."""
+        with self._lock:
+            self._closed = True
+            idle = self._idle
+            self._idle = 0
+        for _ in range(idle):
+            self._calls.put(None)
+    
+    def _run(self) -> None:
+        """Pool thread body: run queued calls until shut down."""
+        while True:
+            call = self._calls.get()
+            if call is None:
+                return
+            
+            future, fn, args = call
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            del call, future, fn, args  # Don't pin the message while idle
+            
+            with self._lock:
+                if self._closed:
+                    return
+                self._idle += 1
+
+
+def _process_with_timeout(config, pool: TimeoutCallPool, msg, thread_logger) -> None:
     """Process message with timeout.
     
-    Runs processor_callable in a separate thread with timeout.
-    If timeout is exceeded, raises TimeoutError.
+    Runs processor_callable on a pool thread with timeout.
+    If timeout is exceeded, raises TimeoutError; the call keeps running
+    in the background and its thread rejoins the pool when it returns.
     
     Args:
         config: Configuration object
+        pool: Pool to run the call on
         msg: Kafka message
         thread_logger: Logger instance
         
@@ -124,25 +250,17 @@ def _process_with_timeout(config, msg, thread_logger) -> None:
         TimeoutError: If processing exceeds timeout
         Exception: Any exception raised by processor_callable
     """
-    result_container = []
-    exception_container = []
+    future = pool.submit(config.processor_callable, msg.value)
     
-    def target():
-        """Target function for timeout thread."""
-        try:
-            result = config.processor_callable(msg.value)
-            result_container.append(result)
-        except Exception as e:
-            exception_container.append(e)
-    
-    # Start processing in separate thread
-    process_thread = threading.Thread(target=target, daemon=True)
-    process_thread.start()
-    
-    # Wait for completion or timeout
-    process_thread.join(timeout=config.processing_timeout)
-    
-    if process_thread.is_alive():
+    try:
+        # Result is ignored, only success/failure matters
+        future.result(timeout=config.processing_timeout)
+    except FuturesTimeoutError:
+        if future.done():
+            # Finished just after the wait gave up (or raised TimeoutError
+            # itself): report the call's real outcome
+            return future.result()
+        
         # Timeout exceeded
         thread_logger.warning(
             "Processing timeout exceeded: %ds for offset=%d",
@@ -150,13 +268,7 @@ def _process_with_timeout(config, msg, thread_logger) -> None:
         )
         raise TimeoutError(
             f"Processing exceeded timeout of {config.processing_timeout}s"
-        )
-    
-    # Check if exception occurred
-    if exception_container:
-        raise exception_container[0]
-    
-    # Success (result_container may be empty or have result, we don't care)
+        ) from None
 
 
 def _send_to_dlq(shared_state, msg, error: Exception, processing_time_ms: float) -> None:
@@ -168,51 +280,86 @@ def _send_to_dlq(shared_state, msg, error: Exception, processing_time_ms: float)
         error: Exception that caused failure
         processing_time_ms: Time spent processing (milliseconds)
     """
-    try:
-        dlq_entry = {
-            "msg": msg,
-            "error": type(error).__name__,
-            "error_message": str(error),
-            "stack_trace": traceback.format_exc(),
-            "processing_time_ms": processing_time_ms
-        }
+    stack_trace_limit = shared_state.config.dlq_stack_trace_limit
+    if stack_trace_limit:
+        # Queued entries then pin only the frames that will be written
+        _trim_traceback(error, stack_trace_limit)
+    
+    dlq_entry = DLQEntry(
+        msg=msg,
+        error_type=type(error).__name__,
+        error_message=str(error),
+        # Stack trace is formatted by the DLQ writer, off the worker path.
+        # Not kept when unused, so queued entries don't pin stack frames
+        exception=error if stack_trace_limit != 0 else None,
+        processing_time_ms=processing_time_ms
+    )
+    
+    # Unbounded: never blocks or drops
+    shared_state.dlq_queue.put(dlq_entry)
+    
+    shared_state.logger.debug(
+        "DLQ entry queued: offset=%d, error=%s",
+        msg.offset, type(error).__name__
+    )
+
+
+def _trim_traceback(error: BaseException, limit: int) -> None:
+    """Cut tracebacks down to their innermost frames, in place.
+    
+    Applies to error and every exception chained to it (__cause__ and
+    __context__), matching traceback.format_exception(limit=-limit).
+    Locals of dropped frames that have finished executing are cleared.
+    
+    Args:
+        error: Exception whose traceback(s) to trim
+        limit: Innermost frames to keep per traceback (> 0)
+    """
+    pending = [error]
+    seen = set()
+    while pending:
+        exc = pending.pop()
+        if exc is None or id(exc) in seen:
+            continue
+        seen.add(id(exc))
         
-        shared_state.dlq_queue.put_nowait(dlq_entry)
+        tb = exc.__traceback__
+        depth = 0
+        node = tb
+        while node is not None:
+            depth += 1
+            node = node.tb_next
+        for _ in range(depth - limit):
+            # Kept frames still reach dropped ones via f_back, so release
+            # their locals too
+            try:
+                tb.tb_frame.clear()
+            except RuntimeError:
+                pass  # Still executing (e.g. this worker's own frame)
+            tb = tb.tb_next
+        exc.__traceback__ = tb
         
-        shared_state.logger.debug(
-            "DLQ entry queued: offset=%d, error=%s",
-            msg.offset, type(error).__name__
-        )
-    
-    except queue.Full:
-        # DLQ queue is full - this is critical
-        shared_state.logger.error(
-            "DLQ queue full, cannot record failure for offset %d (error: %s)",
-            msg.offset, type(error).__name__
-        )
+        pending.append(exc.__cause__)
+        pending.append(exc.__context__)
 
 
-def _mark_processed(shared_state, msg, status: str) -> None:
-    """Mark message as processed for offset tracking.
+def _mark_processed(shared_state, marks: List[Tuple[int, int, str]]) -> None:
+    """Mark messages as processed for offset tracking.
     
     Args:
         shared_state: Shared state object
-        msg: Kafka message
-        status: "success" or "failed"
+        marks: (partition, offset, status) per message, status being
+            "success" or "failed"
     """
-    try:
-        shared_state.processed_queue.put_nowait(
-            (msg.partition, msg.offset, status)
-        )
-        
-        shared_state.logger.debug(
-            "Marked processed: partition=%d, offset=%d, status=%s",
-            msg.partition, msg.offset, status
-        )
+    # Unbounded queue: never blocks or drops
+    shared_state.processed_queue.put_many(marks)
+    # Only the first mark after a drain pays for the Event's lock
+    if not shared_state.processed_event.is_set():
+        shared_state.processed_event.set()
     
-    except queue.Full:
-        # Processed queue is full - this is critical for offset tracking
-        shared_state.logger.error(
-            "Processed queue full, cannot track offset %d (status: %s)",
-            msg.offset, status
-        )
+    if shared_state.logger.isEnabledFor(logging.DEBUG):
+        for partition, offset, status in marks:
+            shared_state.logger.debug(
+                "Marked processed: partition=%d, offset=%d, status=%s",
+                partition, offset, status
+            )
@@ -190,8 +190,8 @@ class TestSaveRegistry:
         
         registry = ModRegistry(str(registry_file))
         
-        # Mock os.rename to raise PermissionError after temp file is created
-        with patch('os.rename', side_effect=PermissionError("Access denied")):
+        # Mock os.replace to raise PermissionError after temp file is created
+        with patch('os.replace', side_effect=PermissionError("Access denied")):
             with pytest.raises(RuntimeError, match="Failed to save registry"):
                 registry._save_registry()
 
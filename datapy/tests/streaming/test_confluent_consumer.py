@@ -0,0 +1,201 @@
+"""
+Test cases for datapy.mods.duckdb.streaming.confluent_consumer module.
+
+Tests ConfluentConsumerAdapter against a stub confluent_kafka module, so
+confluent-kafka does not need to be installed.
+"""
+
+import sys
+import types
+from collections import namedtuple
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+# Add project root to Python path for testing
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from datapy.mods.duckdb.streaming.confluent_consumer import (
+    ConfluentConsumerAdapter,
+    ConsumerRecord
+)
+from datapy.mods.duckdb.streaming.shared_state import KafkaConsumerConfig
+
+
+PARTITION_EOF = -191
+TRANSPORT = -195
+ALL_BROKERS_DOWN = -187
+
+
+class StubKafkaException(Exception):
+    """Stand-in for confluent_kafka.KafkaException."""
+
+
+class StubKafkaError:
+    """Stand-in for confluent_kafka.KafkaError."""
+    
+    _PARTITION_EOF = PARTITION_EOF
+    
+    def __init__(self, code, fatal=False):
+        self._code = code
+        self._fatal = fatal
+    
+    def code(self):
+        return self._code
+    
+    def fatal(self):
+        return self._fatal
+    
+    def __str__(self):
+        return f"KafkaError(code={self._code})"
+
+
+class StubMessage:
+    """Stand-in for confluent_kafka.Message."""
+    
+    def __init__(self, partition=0, offset=0, error=None, topic="test-topic"):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._error = error
+    
+    def error(self):
+        return self._error
+    
+    def topic(self):
+        return self._topic
+    
+    def partition(self):
+        return self._partition
+    
+    def offset(self):
+        return self._offset
+    
+    def key(self):
+        return b"key-%d" % self._offset
+    
+    def value(self):
+        return b"value-%d" % self._offset
+
+
+def error_event(code, fatal=False):
+    """Consumer error event as returned by consume()."""
+    return StubMessage(error=StubKafkaError(code, fatal))
+
+
+@pytest.fixture
+def stub_kafka():
+    """Stub confluent_kafka module installed in sys.modules."""
+    module = types.ModuleType("confluent_kafka")
+    module.Consumer = MagicMock()
+    module.KafkaError = StubKafkaError
+    module.KafkaException = StubKafkaException
+    module.TopicPartition = MagicMock(side_effect=lambda *args: args)
+    with patch.dict(sys.modules, {"confluent_kafka": module}):
+        yield module
+
+
+@pytest.fixture
+def adapter(stub_kafka):
+    """Adapter wrapping the stub consumer."""
+    config = KafkaConsumerConfig(
+        bootstrap_servers="localhost:9092",
+        topic="test-topic",
+        group_id="test-group",
+        processor_callable=lambda value: None
+    )
+    return ConfluentConsumerAdapter(config)
+
+
+def consumer_of(stub_kafka):
+    """The stub Consumer instance the adapter created."""
+    return stub_kafka.Consumer.return_value
+
+
+class TestInit:
+    """Test cases for adapter construction."""
+    
+    def test_manual_commit_and_subscribe(self, stub_kafka, adapter):
+        """Test consumer is created with auto commit off and subscribed."""
+        settings = stub_kafka.Consumer.call_args[0][0]
+        assert settings["enable.auto.commit"] is False
+        assert settings["group.id"] == "test-group"
+        consumer_of(stub_kafka).subscribe.assert_called_once_with(["test-topic"])
+
+
+class TestPoll:
+    """Test cases for ConfluentConsumerAdapter.poll."""
+    
+    def test_groups_records_by_partition(self, stub_kafka, adapter):
+        """Test records are grouped per (topic, partition) in offset order."""
+        consumer_of(stub_kafka).consume.return_value = [
+            StubMessage(0, 10), StubMessage(1, 5), StubMessage(0, 11)
+        ]
+        
+        batch = adapter.poll(timeout_ms=500, max_records=100)
+        
+        assert [r.offset for r in batch[("test-topic", 0)]] == [10, 11]
+        assert [r.offset for r in batch[("test-topic", 1)]] == [5]
+        assert batch[("test-topic", 0)][0] == ConsumerRecord(
+            "test-topic", 0, 10, b"key-10", b"value-10"
+        )
+        consumer_of(stub_kafka).consume.assert_called_once_with(num_messages=100, timeout=0.5)
+    
+    def test_partition_eof_skipped(self, stub_kafka, adapter):
+        """Test partition EOF events are skipped."""
+        consumer_of(stub_kafka).consume.return_value = [
+            StubMessage(0, 1), error_event(PARTITION_EOF)
+        ]
+        
+        batch = adapter.poll(timeout_ms=100, max_records=10)
+        
+        assert [r.offset for r in batch[("test-topic", 0)]] == [1]
+    
+    @pytest.mark.parametrize("code", [TRANSPORT, ALL_BROKERS_DOWN])
+    def test_non_fatal_error_keeps_records(self, stub_kafka, adapter, code):
+        """Test records around a transient error are still returned."""
+        consumer_of(stub_kafka).consume.return_value = [
+            StubMessage(0, 1), StubMessage(0, 2), error_event(code), StubMessage(0, 3)
+        ]
+        
+        batch = adapter.poll(timeout_ms=100, max_records=10)
+        
+        assert [r.offset for r in batch[("test-topic", 0)]] == [1, 2, 3]
+    
+    def test_fatal_error_raises(self, stub_kafka, adapter):
+        """Test a fatal error raises KafkaException."""
+        consumer_of(stub_kafka).consume.return_value = [
+            StubMessage(0, 1), error_event(TRANSPORT, fatal=True)
+        ]
+        
+        with pytest.raises(StubKafkaException):
+            adapter.poll(timeout_ms=100, max_records=10)
+    
+    def test_empty_result(self, stub_kafka, adapter):
+        """Test empty consume() result gives an empty batch."""
+        consumer_of(stub_kafka).consume.return_value = []
+        
+        assert adapter.poll(timeout_ms=100, max_records=10) == {}
+
+
+class TestCommitAndClose:
+    """Test cases for commit and close."""
+    
+    def test_commit_is_synchronous(self, stub_kafka, adapter):
+        """Test commit translates offsets and commits synchronously."""
+        tp = namedtuple("TopicPartition", "topic partition")("test-topic", 2)
+        meta = namedtuple("OffsetAndMetadata", "offset metadata")(42, "")
+        
+        adapter.commit({tp: meta})
+        
+        consumer_of(stub_kafka).commit.assert_called_once_with(
+            offsets=[("test-topic", 2, 42)], asynchronous=False
+        )
+    
+    def test_close(self, stub_kafka, adapter):
+        """Test close closes the consumer."""
+        adapter.close()
+        
+        consumer_of(stub_kafka).close.assert_called_once_with()
@@ -0,0 +1,123 @@
+"""
+Test cases for datapy.mods.duckdb.streaming.csv_writers module.
+
+Tests compressed CSV output and the specialized backup row encoder.
+"""
+
+import io
+import csv
+import sys
+import gzip
+from pathlib import Path
+
+# Add project root to Python path for testing
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from datapy.mods.duckdb.streaming.csv_writers import (
+    _encode_backup_row,
+    _open_csv_file
+)
+from datapy.mods.duckdb.streaming.shared_state import BackupEntry
+
+
+def csv_writer_line(row):
+    """Encode a backup row with csv.writer, decoding key and value as before."""
+    timestamp, topic, partition, offset, key, value, message_size = row
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([
+        timestamp,
+        topic,
+        partition,
+        offset,
+        key.decode('utf-8', 'replace') if key else None,
+        value.decode('utf-8', 'replace') if value else None,
+        message_size
+    ])
+    return buffer.getvalue()
+
+
+class TestGzipOutput:
+    """Test cases for gzip compressed CSV files."""
+    
+    def test_readable_after_each_batch(self, tmp_path):
+        """Test flushed batches decompress while the file is still open."""
+        path = tmp_path / "backup.csv.gz"
+        csv_file, end_frame = _open_csv_file(str(path), "gzip")
+        try:
+            csv_file.write("a,b\r\n")
+            csv_file.flush()
+            end_frame()
+            assert gzip.decompress(path.read_bytes()) == b"a,b\r\n"
+            
+            csv_file.write("c,d\r\ne,f\r\n")
+            csv_file.flush()
+            end_frame()
+            assert gzip.decompress(path.read_bytes()) == b"a,b\r\nc,d\r\ne,f\r\n"
+        finally:
+            csv_file.close()
+    
+    def test_close_ends_pending_member(self, tmp_path):
+        """Test unflushed rows are terminated on close."""
+        path = tmp_path / "backup.csv.gz"
+        csv_file, _ = _open_csv_file(str(path), "gzip")
+        csv_file.write("a,b\r\n")
+        csv_file.close()
+        
+        assert gzip.decompress(path.read_bytes()) == b"a,b\r\n"
+    
+    def test_reopen_appends(self, tmp_path):
+        """Test reopening appends members that read as one stream."""
+        path = tmp_path / "backup.csv.gz"
+        for row in ("a,b\r\n", "c,d\r\n"):
+            csv_file, _ = _open_csv_file(str(path), "gzip")
+            csv_file.write(row)
+            csv_file.close()
+        
+        with gzip.open(path, "rt", newline="") as f:
+            assert f.read() == "a,b\r\nc,d\r\n"
+
+
+class TestEncodeBackupRow:
+    """Test cases for _encode_backup_row parity with csv.writer."""
+    
+    @pytest.mark.parametrize("payload", [
+        b"plain",
+        b"with,comma",
+        b'with "quotes"',
+        b'"',
+        b"line\nbreak",
+        b"carriage\rreturn",
+        b"crlf\r\nend",
+        b",\"\r\n",
+        b" leading and trailing spaces ",
+        b"\xff\xfeinvalid utf-8",
+        "unicode \u00e9\u4e2d".encode("utf-8"),
+        None,
+        b"",
+    ], ids=repr)
+    def test_matches_csv_writer(self, payload):
+        """Test key and value fields encode exactly like csv.writer."""
+        for key, value in ((payload, b"v"), (b"k", payload), (payload, payload)):
+            row = BackupEntry(
+                "2024-01-01T00:00:00+00:00", "test-topic", 3, 12345,
+                key, value, len(value) if value else 0
+            )
+            
+            assert _encode_backup_row(row) == csv_writer_line(row)
+    
+    def test_round_trip(self):
+        """Test encoded rows parse back with csv.reader."""
+        row = BackupEntry(
+            "2024-01-01T00:00:00+00:00", "test-topic", 0, 7,
+            b"k,1", b'say "hi"\r\nbye', 14
+        )
+        
+        parsed = next(csv.reader(io.StringIO(_encode_backup_row(row), newline="")))
+        
+        assert parsed == [
+            "2024-01-01T00:00:00+00:00", "test-topic", "0", "7",
+            "k,1", 'say "hi"\r\nbye', "14"
+        ]
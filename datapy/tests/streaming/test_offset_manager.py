@@ -0,0 +1,255 @@
+"""
+Test cases for datapy.mods.duckdb.streaming.offset_manager module.
+
+Tests the OffsetRanges set behind the at-least-once commit bookkeeping
+and the max contiguous offset search.
+"""
+
+import sys
+import random
+from pathlib import Path
+
+# Add project root to Python path for testing
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from datapy.mods.duckdb.streaming import offset_manager
+from datapy.mods.duckdb.streaming.offset_manager import (
+    OffsetRanges,
+    VECTORIZED_ADD_MIN,
+    _find_max_contiguous
+)
+
+
+def make_ranges(*ranges):
+    """Build an OffsetRanges from (low, high) pairs."""
+    offsets = OffsetRanges()
+    for low, high in ranges:
+        offsets.add_range(low, high)
+    return offsets
+
+
+def expand(offsets):
+    """List every offset held by an OffsetRanges, in order."""
+    return [o for low, high in offsets.ranges() for o in range(low, high + 1)]
+
+
+def assert_matches(offsets, expected):
+    """Check an OffsetRanges against a reference set, invariants included."""
+    ranges = list(offsets.ranges())
+    assert expand(offsets) == sorted(expected)
+    assert len(offsets) == len(expected)
+    assert bool(offsets) == bool(expected)
+    # Sorted, non-empty and never adjacent or overlapping
+    for low, high in ranges:
+        assert low <= high
+    for (_, high), (low, _) in zip(ranges, ranges[1:]):
+        assert low > high + 1
+    if expected:
+        assert offsets.highest() == max(expected)
+
+
+@pytest.fixture(params=[False, True], ids=["pure-python", "numpy"])
+def has_numpy(request, monkeypatch):
+    """Run add_many with and without numpy."""
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(offset_manager, "_HAS_NUMPY", request.param)
+    return request.param
+
+
+class TestAdd:
+    """Test cases for OffsetRanges.add."""
+    
+    def test_isolated_offsets(self):
+        """Test non-adjacent offsets become separate ranges."""
+        offsets = OffsetRanges()
+        for offset in (5, 1, 9):
+            offsets.add(offset)
+        
+        assert list(offsets.ranges()) == [(1, 1), (5, 5), (9, 9)]
+    
+    def test_extends_previous_range(self):
+        """Test offset right after a range extends it."""
+        offsets = make_ranges((1, 3))
+        offsets.add(4)
+        
+        assert list(offsets.ranges()) == [(1, 4)]
+    
+    def test_extends_next_range(self):
+        """Test offset right before a range extends it downwards."""
+        offsets = make_ranges((5, 7))
+        offsets.add(4)
+        
+        assert list(offsets.ranges()) == [(4, 7)]
+    
+    def test_bridges_two_ranges(self):
+        """Test offset filling a one-offset gap merges both ranges."""
+        offsets = make_ranges((1, 3), (5, 7))
+        offsets.add(4)
+        
+        assert list(offsets.ranges()) == [(1, 7)]
+    
+    def test_duplicate_ignored(self):
+        """Test adding a held offset changes nothing."""
+        offsets = make_ranges((1, 3))
+        offsets.add(2)
+        offsets.add(3)
+        
+        assert list(offsets.ranges()) == [(1, 3)]
+        assert len(offsets) == 3
+
+
+class TestAddRange:
+    """Test cases for OffsetRanges.add_range."""
+    
+    def test_merges_overlapping_and_touching(self):
+        """Test a range swallows every range it overlaps or touches."""
+        offsets = make_ranges((0, 1), (3, 4), (7, 8), (12, 13))
+        offsets.add_range(2, 10)
+        
+        assert list(offsets.ranges()) == [(0, 10), (12, 13)]
+    
+    def test_inside_existing(self):
+        """Test a range already held changes nothing."""
+        offsets = make_ranges((0, 10))
+        offsets.add_range(3, 5)
+        
+        assert list(offsets.ranges()) == [(0, 10)]
+
+
+class TestAddMany:
+    """Test cases for OffsetRanges.add_many."""
+    
+    def test_small_batch(self, has_numpy):
+        """Test batches below the vectorized threshold."""
+        offsets = OffsetRanges()
+        offsets.add_many([3, 1, 2, 7])
+        
+        assert list(offsets.ranges()) == [(1, 3), (7, 7)]
+    
+    def test_large_batch_with_duplicates(self, has_numpy):
+        """Test unsorted large batches with duplicates and gaps."""
+        batch = list(range(100, 300)) + list(range(150, 160)) + [500, 502, 501, 900]
+        random.Random(1).shuffle(batch)
+        assert len(batch) >= VECTORIZED_ADD_MIN
+        
+        offsets = make_ranges((0, 99), (1000, 1001))
+        offsets.add_many(batch)
+        
+        assert list(offsets.ranges()) == [(0, 299), (500, 502), (900, 900), (1000, 1001)]
+
+
+class TestTrimBelow:
+    """Test cases for OffsetRanges.trim_below."""
+    
+    def test_drops_whole_ranges(self):
+        """Test ranges entirely below the offset are removed."""
+        offsets = make_ranges((0, 2), (5, 6), (9, 9))
+        offsets.trim_below(7)
+        
+        assert list(offsets.ranges()) == [(9, 9)]
+    
+    def test_cuts_range_in_middle(self):
+        """Test a range spanning the offset is shortened."""
+        offsets = make_ranges((0, 10), (20, 30))
+        offsets.trim_below(4)
+        
+        assert list(offsets.ranges()) == [(4, 10), (20, 30)]
+        assert len(offsets) == 18
+    
+    def test_everything_removed(self):
+        """Test trimming above the highest offset empties the set."""
+        offsets = make_ranges((0, 10))
+        offsets.trim_below(11)
+        
+        assert not offsets
+        assert len(offsets) == 0
+
+
+class TestRandomized:
+    """Randomized checks of OffsetRanges against a plain set."""
+    
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_set(self, has_numpy, seed):
+        """Test random adds and trims give the same offsets as a set."""
+        rng = random.Random(seed)
+        offsets = OffsetRanges()
+        expected = set()
+        floor = 0
+        
+        for _ in range(300):
+            operation = rng.random()
+            if operation < 0.4:
+                offset = rng.randrange(floor, floor + 200)
+                offsets.add(offset)
+                expected.add(offset)
+            elif operation < 0.6:
+                low = rng.randrange(floor, floor + 200)
+                high = low + rng.randrange(0, 20)
+                offsets.add_range(low, high)
+                expected.update(range(low, high + 1))
+            elif operation < 0.9:
+                size = rng.choice([5, VECTORIZED_ADD_MIN, 150])
+                base = rng.randrange(floor, floor + 200)
+                batch = [base + rng.randrange(0, size * 2) for _ in range(size)]
+                offsets.add_many(batch)
+                expected.update(batch)
+            else:
+                floor += rng.randrange(0, 30)
+                offsets.trim_below(floor)
+                expected = {o for o in expected if o >= floor}
+            
+            assert_matches(offsets, expected)
+
+
+class TestFindMaxContiguous:
+    """Test cases for _find_max_contiguous."""
+    
+    def test_new_partition(self):
+        """Test offsets from 0 are committable on a new partition."""
+        assert _find_max_contiguous(make_ranges((0, 2)), -1) == 2
+    
+    def test_stops_at_gap(self):
+        """Test the search stops at the first missing offset."""
+        offsets = make_ranges((1001, 1003), (1005, 1006))
+        
+        assert _find_max_contiguous(offsets, 1000) == 1003
+    
+    def test_no_progress(self):
+        """Test last_committed is returned when the next offset is missing."""
+        assert _find_max_contiguous(make_ranges((1002, 1003)), 1000) == 1000
+        assert _find_max_contiguous(OffsetRanges(), 1000) == 1000
+    
+    def test_range_spanning_last_committed(self):
+        """Test a range starting below last_committed still counts."""
+        assert _find_max_contiguous(make_ranges((990, 1010)), 1000) == 1010
+    
+    def test_skips_ranges_at_or_below_last_committed(self):
+        """Test redelivered offsets at or below last_committed don't block commits.
+        
+        A set-based search stopped at the first of them, so the partition
+        could never commit again.
+        """
+        offsets = make_ranges((3, 5), (990, 1000), (1001, 1004), (1010, 1011))
+        
+        assert _find_max_contiguous(offsets, 1000) == 1004
+        assert _find_max_contiguous(make_ranges((3, 5)), 1000) == 1000
+    
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_set(self, seed):
+        """Test against walking a plain set from last_committed + 1."""
+        rng = random.Random(seed)
+        for _ in range(50):
+            expected = set(rng.sample(range(0, 60), rng.randrange(0, 60)))
+            offsets = OffsetRanges()
+            offsets.add_many(list(expected))
+            last_committed = rng.randrange(-1, 60)
+            
+            max_contiguous = last_committed
+            while max_contiguous + 1 in expected:
+                max_contiguous += 1
+            
+            assert _find_max_contiguous(offsets, last_committed) == max_contiguous
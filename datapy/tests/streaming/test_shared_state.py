@@ -0,0 +1,290 @@
+"""
+Test cases for datapy.mods.duckdb.streaming.shared_state module.
+
+Tests BatchQueue bulk operations used for every handoff between the
+consumer's threads, SharedState queue setup and config validation.
+"""
+
+import sys
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+# Add project root to Python path for testing
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from datapy.mods.duckdb.streaming.shared_state import (
+    BatchQueue,
+    KafkaConsumerConfig,
+    SharedState,
+    validate_config
+)
+
+
+def make_config(**overrides):
+    """Build a minimal consumer config."""
+    return KafkaConsumerConfig(
+        bootstrap_servers="localhost:9092",
+        topic="test-topic",
+        group_id="test-group",
+        processor_callable=lambda value: None,
+        **overrides
+    )
+
+
+def start_thread(target, *args):
+    """Start a daemon thread running target(*args)."""
+    thread = threading.Thread(target=target, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestPutMany:
+    """Test cases for BatchQueue.put_many."""
+    
+    def test_unbounded(self):
+        """Test all items are enqueued in order on an unbounded queue."""
+        q = BatchQueue()
+        
+        assert q.put_many([1, 2, 3]) == 3
+        assert q.put_many([]) == 0
+        assert list(q.queue) == [1, 2, 3]
+        assert q.unfinished_tasks == 3
+    
+    def test_partial_enqueue_on_timeout(self):
+        """Test items that fit are enqueued and the count is returned."""
+        q = BatchQueue(maxsize=3)
+        q.put(0)
+        
+        start = time.monotonic()
+        assert q.put_many([1, 2, 3, 4], timeout=0.1) == 2
+        
+        assert time.monotonic() - start >= 0.1
+        assert list(q.queue) == [0, 1, 2]
+    
+    def test_waits_for_free_slots(self):
+        """Test blocked tail is enqueued as a consumer frees slots."""
+        q = BatchQueue(maxsize=2)
+        
+        def consume():
+            for _ in range(4):
+                time.sleep(0.02)
+                q.get()
+        
+        thread = start_thread(consume)
+        assert q.put_many([1, 2, 3, 4, 5, 6]) == 6
+        thread.join(5)
+        assert list(q.queue) == [5, 6]
+    
+    def test_timeout_restarts_on_progress(self):
+        """Test timeout counts from the last enqueued item, not the call."""
+        q = BatchQueue(maxsize=2)
+        
+        def consume():
+            for _ in range(3):
+                time.sleep(0.15)
+                q.get()
+        
+        thread = start_thread(consume)
+        # 0.45s in total, but a slot frees up every 0.15s
+        assert q.put_many([1, 2, 3, 4, 5], timeout=0.4) == 5
+        thread.join(5)
+
+
+class TestGetBatch:
+    """Test cases for BatchQueue.get_batch."""
+    
+    def test_takes_up_to_max_items(self):
+        """Test batch is capped at max_items, in FIFO order."""
+        q = BatchQueue()
+        q.put_many(list(range(10)))
+        
+        assert q.get_batch(4) == [0, 1, 2, 3]
+        assert q.get_batch(100) == [4, 5, 6, 7, 8, 9]
+    
+    def test_timeout_returns_empty(self):
+        """Test empty list when nothing arrives before the timeout."""
+        q = BatchQueue()
+        
+        assert q.get_batch(10, timeout=0.05) == []
+    
+    def test_waits_only_for_first_item(self):
+        """Test a waiting consumer returns as soon as one item arrives."""
+        q = BatchQueue()
+        results = []
+        
+        thread = start_thread(lambda: results.append(q.get_batch(10, timeout=5)))
+        time.sleep(0.05)
+        q.put("a")
+        thread.join(5)
+        
+        assert results == [["a"]]
+    
+    def test_frees_slots_for_producers(self):
+        """Test taking a batch wakes producers blocked on a full queue."""
+        q = BatchQueue(maxsize=2)
+        q.put_many([1, 2])
+        results = []
+        
+        thread = start_thread(lambda: results.append(q.put_many([3, 4], timeout=5)))
+        time.sleep(0.05)
+        assert q.get_batch(2) == [1, 2]
+        thread.join(5)
+        
+        assert results == [2]
+        assert list(q.queue) == [3, 4]
+    
+    def test_fair_share_cap(self):
+        """Test a burst is split among consumers still waiting."""
+        q = BatchQueue()
+        # Three consumers waiting, this one wakes first
+        q._waiting = 3
+        q.put_many(list(range(8)))
+        
+        # ceil(8 / 4) = 2, though max_items allows 10
+        assert q.get_batch(10) == [0, 1]
+    
+    def test_fair_share_spreads_burst(self):
+        """Test idle consumers each get part of a burst."""
+        q = BatchQueue()
+        results = []
+        lock = threading.Lock()
+        
+        def consume():
+            batch = q.get_batch(10, timeout=5)
+            with lock:
+                results.append(batch)
+        
+        threads = [start_thread(consume) for _ in range(4)]
+        while q._waiting < 4:
+            time.sleep(0.01)
+        q.put_many(list(range(8)))
+        for thread in threads:
+            thread.join(5)
+        
+        assert sorted(item for batch in results for item in batch) == list(range(8))
+        assert max(len(batch) for batch in results) < 8
+
+
+class TestClose:
+    """Test cases for BatchQueue.close."""
+    
+    def test_wakes_blocked_waiters(self):
+        """Test close() releases consumers waiting without a timeout."""
+        q = BatchQueue()
+        results = []
+        
+        threads = [start_thread(lambda: results.append(q.get_batch(10))) for _ in range(3)]
+        time.sleep(0.05)
+        q.close()
+        for thread in threads:
+            thread.join(5)
+        
+        assert results == [[], [], []]
+        assert q._waiting == 0
+    
+    def test_queued_items_still_returned(self):
+        """Test items queued before close() are still handed out."""
+        q = BatchQueue()
+        q.put_many([1, 2])
+        q.close()
+        
+        assert q.get_batch(10) == [1, 2]
+        assert q.get_batch(10) == []
+
+
+class TestDrainAll:
+    """Test cases for BatchQueue.drain_all."""
+    
+    def test_returns_all_items(self):
+        """Test every queued item is returned in FIFO order."""
+        q = BatchQueue()
+        q.put_many([1, 2, 3])
+        
+        assert list(q.drain_all()) == [1, 2, 3]
+        assert q.qsize() == 0
+    
+    def test_never_hands_out_live_deque(self):
+        """Test the returned deque is not the queue's own storage."""
+        q = BatchQueue()
+        
+        empty = q.drain_all()
+        assert isinstance(empty, deque)
+        assert empty is not q.queue
+        
+        q.put_many([1])
+        drained = q.drain_all()
+        assert drained is not q.queue
+        q.put(2)
+        assert list(drained) == [1]
+    
+    def test_wakes_producers(self):
+        """Test draining a full queue releases blocked producers."""
+        q = BatchQueue(maxsize=1)
+        q.put(1)
+        results = []
+        
+        thread = start_thread(lambda: results.append(q.put_many([2], timeout=5)))
+        time.sleep(0.05)
+        q.drain_all()
+        thread.join(5)
+        
+        assert results == [1]
+
+
+class TestSharedStateQueues:
+    """Test cases for SharedState processing queue setup."""
+    
+    def test_processing_queue_is_single_shard(self):
+        """Test processing_queue is the only shard by default."""
+        shared_state = SharedState(make_config(queue_size=10))
+        
+        assert shared_state.processing_queues == [shared_state.processing_queue]
+        assert shared_state.processing_queue.maxsize == 10
+    
+    def test_processing_queue_is_shard_zero(self):
+        """Test processing_queue is shard 0 when sharded."""
+        shared_state = SharedState(make_config(queue_size=10, processing_queue_shards=2))
+        
+        assert shared_state.processing_queue is shared_state.processing_queues[0]
+        assert len(shared_state.processing_queues) == 2
+    
+    def test_stop_closes_every_shard(self):
+        """Test stop() releases workers waiting on any shard."""
+        shared_state = SharedState(make_config(processing_queue_shards=2))
+        
+        shared_state.stop()
+        
+        assert all(q.get_batch(10) == [] for q in shared_state.processing_queues)
+
+
+class TestDeprecatedConfig:
+    """Test cases for deprecated config fields in validate_config."""
+    
+    @pytest.mark.parametrize("name", [
+        "csv_rotation_check_interval_seconds",
+        "worker_queue_get_timeout_seconds",
+    ])
+    def test_changed_field_logs_warning(self, caplog, name):
+        """Test a changed deprecated field is reported on the consumer logger."""
+        config = make_config(**{name: 0})
+        
+        with caplog.at_level(logging.WARNING, logger=config.mod_name):
+            validate_config(config)
+        
+        assert [r.name for r in caplog.records] == [config.mod_name]
+        assert f"{name} is deprecated" in caplog.records[0].getMessage()
+    
+    def test_defaults_log_nothing(self, caplog):
+        """Test default values are accepted silently."""
+        config = make_config()
+        
+        with caplog.at_level(logging.WARNING, logger=config.mod_name):
+            validate_config(config)
+        
+        assert caplog.records == []
@@ -0,0 +1,182 @@
+"""
+Test cases for datapy.mods.duckdb.streaming.worker_pool module.
+
+Tests processor timeouts, the shared TimeoutCallPool and DLQ entries.
+"""
+
+import sys
+import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path for testing
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+from datapy.mods.duckdb.streaming.shared_state import KafkaConsumerConfig, SharedState
+from datapy.mods.duckdb.streaming.worker_pool import (
+    TimeoutCallPool,
+    _process_with_timeout,
+    _send_to_dlq
+)
+
+
+def make_config(processor_callable=lambda value: None, **overrides):
+    """Build a minimal consumer config."""
+    return KafkaConsumerConfig(
+        bootstrap_servers="localhost:9092",
+        topic="test-topic",
+        group_id="test-group",
+        processor_callable=processor_callable,
+        **overrides
+    )
+
+
+class LateFuture(Future):
+    """Future whose timed wait gives up just before the call finishes."""
+    
+    def __init__(self, outcome):
+        super().__init__()
+        self._outcome = outcome
+    
+    def result(self, timeout=None):
+        if timeout is not None and not self.done():
+            # Call completes between the wait timing out and done()
+            if isinstance(self._outcome, BaseException):
+                self.set_exception(self._outcome)
+            else:
+                self.set_result(self._outcome)
+            raise FuturesTimeoutError()
+        return super().result()
+
+
+def late_pool(outcome):
+    """Pool stub whose calls finish just after their wait times out."""
+    pool = MagicMock()
+    pool.submit.return_value = LateFuture(outcome)
+    return pool
+
+
+class TestProcessWithTimeout:
+    """Test cases for _process_with_timeout."""
+    
+    def test_success(self):
+        """Test successful call returns normally."""
+        config = make_config(processing_timeout=5)
+        pool = TimeoutCallPool()
+        try:
+            _process_with_timeout(config, pool, MagicMock(value=b"x"), MagicMock())
+        finally:
+            pool.shutdown()
+    
+    def test_processor_error_propagates(self):
+        """Test processor exception is raised as-is."""
+        def fail(value):
+            raise ValueError("bad message")
+        
+        config = make_config(fail, processing_timeout=5)
+        pool = TimeoutCallPool()
+        try:
+            with pytest.raises(ValueError, match="bad message"):
+                _process_with_timeout(config, pool, MagicMock(value=b"x"), MagicMock())
+        finally:
+            pool.shutdown()
+    
+    def test_timeout_exceeded(self):
+        """Test a hung call raises TimeoutError with a message."""
+        release = threading.Event()
+        config = make_config(lambda value: release.wait(5), processing_timeout=0.05)
+        pool = TimeoutCallPool()
+        try:
+            with pytest.raises(TimeoutError, match="exceeded timeout"):
+                _process_with_timeout(config, pool, MagicMock(value=b"x", offset=1), MagicMock())
+        finally:
+            release.set()
+            pool.shutdown()
+    
+    def test_late_success_is_success(self):
+        """Test a call finishing right after the wait times out succeeds."""
+        config = make_config(processing_timeout=1)
+        
+        _process_with_timeout(config, late_pool("ok"), MagicMock(value=b"x"), MagicMock())
+    
+    def test_late_error_keeps_its_type(self):
+        """Test a call failing right after the wait times out keeps its error."""
+        config = make_config(processing_timeout=1)
+        
+        with pytest.raises(ValueError, match="bad message"):
+            _process_with_timeout(
+                config, late_pool(ValueError("bad message")), MagicMock(value=b"x"), MagicMock()
+            )
+
+
+class TestTimeoutPoolSetup:
+    """Test cases for SharedState.timeout_pool."""
+    
+    def test_created_with_processing_timeout(self):
+        """Test pool exists as soon as the shared state does."""
+        shared_state = SharedState(make_config(processing_timeout=5))
+        
+        assert isinstance(shared_state.timeout_pool, TimeoutCallPool)
+        shared_state.timeout_pool.shutdown()
+    
+    def test_absent_without_processing_timeout(self):
+        """Test no pool without processing_timeout."""
+        shared_state = SharedState(make_config())
+        
+        assert shared_state.timeout_pool is None
+
+
+def fail_deeply(depth):
+    """Raise ValueError from depth nested calls."""
+    if depth == 0:
+        raise ValueError("bad message")
+    fail_deeply(depth - 1)
+
+
+def traceback_depth(error):
+    """Number of frames in an exception's traceback."""
+    depth = 0
+    tb = error.__traceback__
+    while tb is not None:
+        depth += 1
+        tb = tb.tb_next
+    return depth
+
+
+class TestSendToDlq:
+    """Test cases for _send_to_dlq stack trace capping."""
+    
+    def send(self, **overrides):
+        """Fail a message 30 frames deep and return its queued DLQ entry."""
+        shared_state = SharedState(make_config(**overrides))
+        msg = MagicMock(partition=0, offset=1)
+        try:
+            fail_deeply(30)
+        except ValueError as e:
+            _send_to_dlq(shared_state, msg, e, 1.0)
+        return shared_state.dlq_queue.get_nowait()
+    
+    def test_capped_at_ten_frames_by_default(self):
+        """Test queued tracebacks keep the 10 innermost frames by default."""
+        entry = self.send()
+        
+        assert traceback_depth(entry.exception) == 10
+        assert entry.exception.__traceback__.tb_frame.f_code.co_name == "fail_deeply"
+    
+    def test_none_keeps_full_traceback(self):
+        """Test None opts out of the cap."""
+        entry = self.send(dlq_stack_trace_limit=None)
+        
+        assert traceback_depth(entry.exception) > 30
+    
+    def test_zero_keeps_no_exception(self):
+        """Test 0 drops the exception entirely."""
+        entry = self.send(dlq_stack_trace_limit=0)
+        
+        assert entry.exception is None
+        assert entry.error_type == "ValueError"
+        assert entry.error_message == "bad message"
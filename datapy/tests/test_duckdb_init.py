@@ -344,7 +344,7 @@ class TestLogging:
         
         # Check that debug logging was called
         mock_logger.debug.assert_any_call(
-            "Initializing DuckDB connection with memory_limit=2GB"
+            "Initializing DuckDB connection with memory_limit=%s", "2GB"
         )
     
     @patch('datapy.mods.duckdb.duckdb_init.duckdb.connect')
@@ -360,7 +360,7 @@ class TestLogging:
         
         # Check that custom config logging was called
         mock_logger.debug.assert_any_call(
-            "Merging 2 custom config settings"
+            "Merging %d custom config settings", 2
         )
     
     @patch('datapy.mods.duckdb.duckdb_init.duckdb.connect')